@@ -1,10 +1,16 @@
 # api/main.py
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 import emo
+from emo.config import get_settings
+from emo.data_sources import close_async_client
 from fastapi import FastAPI
 
-from api.routers import metrics, uia
+from api.middleware import InflightLimitMiddleware, LatencyStatsMiddleware
+from api.routers import interfaces, metrics, uia
 
 DESCRIPTION = """
 EMO-Core API
@@ -15,14 +21,39 @@ digital-twin teams, and funders who want to integrate EMO metrics into
 their own infrastructure.
 """
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Release pooled outbound HTTP connections when the worker shuts down.
+    """
+    yield
+    await close_async_client()
+
+
 app = FastAPI(
     title="EMO-Core API",
     version=getattr(emo, "__version__", "0.1.0"),
     description=DESCRIPTION,
+    lifespan=lifespan,
 )
 
+# Middleware -------------------------------------------------------------
+#
+# Each worker rejects requests beyond EMO_MAX_INFLIGHT with a 503 rather
+# than letting them queue. Scale out with processes, e.g. the usual
+# 2n+1 sizing for n cores:
+#
+#     gunicorn api.main:app -k uvicorn.workers.UvicornWorker -w $((2 * $(nproc) + 1))
+
+app.add_middleware(InflightLimitMiddleware, max_inflight=get_settings().max_inflight)
+
+# Outermost: per-route latency, summarised in batches (see api.middleware).
+app.add_middleware(LatencyStatsMiddleware)
+
 # Routers ----------------------------------------------------------------
 
+app.include_router(interfaces.router, prefix="/interfaces", tags=["interfaces"])
 app.include_router(metrics.router)
 app.include_router(uia.router)
 
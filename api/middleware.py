@@ -0,0 +1,178 @@
+# api/middleware.py
+from __future__ import annotations
+
+import logging
+import time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LOG = logging.getLogger(__name__)
+
+
+class InflightLimitMiddleware:
+    """
+    Cap the number of concurrently handled HTTP requests per worker.
+
+    Requests beyond ``max_inflight`` are rejected immediately with
+    ``503 Service Unavailable`` and a ``Retry-After`` header instead of
+    queueing behind slow handlers. Paths in ``exempt_paths`` (by default
+    the load-balancer health check) always pass through.
+
+    A non-positive ``max_inflight`` disables the limit. The counter is a
+    plain integer because all ASGI calls of a worker share one event loop.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_inflight: int,
+        exempt_paths: Iterable[str] = ("/health",),
+        retry_after_seconds: int = 1,
+    ) -> None:
+        self.app = app
+        self._max_inflight = max_inflight
+        self._exempt_paths = frozenset(exempt_paths)
+        self._retry_after = str(retry_after_seconds)
+        self._inflight = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or self._max_inflight <= 0
+            or scope["path"] in self._exempt_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if self._inflight >= self._max_inflight:
+            response = JSONResponse(
+                {"detail": "Server is at capacity; retry shortly."},
+                status_code=503,
+                headers={"Retry-After": self._retry_after},
+            )
+            await response(scope, receive, send)
+            return
+
+        self._inflight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._inflight -= 1
+
+
+class LatencyStatsMiddleware:
+    """
+    Record request latency per route in batches rather than per request.
+
+    Each request only stores one integer (elapsed nanoseconds) into a
+    per-route buffer. A buffer is summarised (count, mean, p50/p95/p99 in
+    milliseconds) and logged once it holds ``batch_size`` samples or
+    ``flush_interval_seconds`` have passed since the route's last flush,
+    so cheap endpoints such as ``/health`` do not pay for a histogram
+    update on every call. The interval is checked when a request arrives,
+    so a route that goes idle keeps its samples until its next request;
+    whatever is still buffered is flushed at application shutdown.
+
+    The most recent summary per route template is kept in
+    :attr:`last_summary` for ops endpoints or tests to inspect.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        batch_size: int = 1024,
+        flush_interval_seconds: float = 1.0,
+    ) -> None:
+        self.app = app
+        self._batch_size = batch_size
+        self._flush_interval_ns = int(flush_interval_seconds * 1e9)
+        self._samples: Dict[str, List[int]] = {}
+        self._last_flush_ns: Dict[str, int] = {}
+        self.last_summary: Dict[str, Dict[str, float]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self.app(scope, self._flush_on_shutdown(receive), send)
+            return
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter_ns()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            end = time.perf_counter_ns()
+            self._record(_route_template(scope), end - start, end)
+
+    def _flush_on_shutdown(self, receive: Receive) -> Receive:
+        async def wrapped() -> Message:
+            message = await receive()
+            if message["type"] == "lifespan.shutdown":
+                self.flush_all()
+            return message
+
+        return wrapped
+
+    def flush_all(self) -> None:
+        """
+        Summarise and log every route's buffered samples now.
+        """
+        now_ns = time.perf_counter_ns()
+        for route in list(self._samples):
+            self._flush(route, now_ns)
+
+    def _record(self, route: str, elapsed_ns: int, now_ns: int) -> None:
+        samples = self._samples.get(route)
+        if samples is None:
+            samples = self._samples[route] = []
+            self._last_flush_ns[route] = now_ns
+        samples.append(elapsed_ns)
+
+        if (
+            len(samples) >= self._batch_size
+            or now_ns - self._last_flush_ns[route] >= self._flush_interval_ns
+        ):
+            self._flush(route, now_ns)
+
+    def _flush(self, route: str, now_ns: int) -> None:
+        samples = self._samples[route]
+        self._samples[route] = []
+        self._last_flush_ns[route] = now_ns
+        if not samples:
+            return
+
+        ms = np.asarray(samples, dtype=np.float64) / 1e6
+        p50, p95, p99 = np.percentile(ms, [50.0, 95.0, 99.0])
+        summary = {
+            "count": float(ms.size),
+            "mean_ms": float(ms.mean()),
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "p99_ms": float(p99),
+        }
+        self.last_summary[route] = summary
+        LOG.info(
+            "latency route=%s n=%d mean=%.2fms p50=%.2fms p95=%.2fms p99=%.2fms",
+            route,
+            ms.size,
+            summary["mean_ms"],
+            summary["p50_ms"],
+            summary["p95_ms"],
+            summary["p99_ms"],
+        )
+
+
+def _route_template(scope: Scope) -> str:
+    """
+    Return the matched route template (e.g. ``/uia/summary``).
+
+    The router stores the matched route in the scope; unmatched requests
+    are grouped together to keep the number of buffers bounded.
+    """
+    route: Optional[object] = scope.get("route")
+    path = getattr(route, "path", None)
+    return path if isinstance(path, str) else "<unmatched>"
@@ -1,23 +1,28 @@
 from __future__ import annotations
 
-from typing import Dict
+import hashlib
+import json
+from typing import Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 
 from emo.data_sources import InterfaceRegistry
 
 router = APIRouter()
 _registry = InterfaceRegistry()
 
+# The registry changes rarely, so the JSON listing is rendered once and
+# re-rendered only when the registry version moves.
+_cached_payload: Optional[bytes] = None
+_cached_etag: Optional[str] = None
+_cached_version: Optional[int] = None
 
-@router.get("/")
-async def list_interfaces() -> Dict[str, Dict]:
-    """
-    Return a list of interfaces Σ_i known to the in-memory registry.
-    """
-    data = {}
-    for iid, iface in _registry.list().items():
-        data[iid] = {
+_CACHE_CONTROL = "public, max-age=300"
+
+
+def _render_interfaces(registry: InterfaceRegistry) -> bytes:
+    data = {
+        iid: {
             "id": iface.id,
             "name": iface.name,
             "class": iface.klass.value,
@@ -26,4 +31,45 @@ async def list_interfaces() -> Dict[str, Dict]:
             "base_url": iface.base_url,
             "uia_roles": iface.uia_roles,
         }
-    return data
+        for iid, iface in registry.list().items()
+    }
+    return json.dumps(data).encode("utf-8")
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+@router.get("/")
+async def list_interfaces(request: Request) -> Response:
+    """
+    Return a list of interfaces Σ_i known to the in-memory registry.
+
+    Responses carry a content-derived ETag; clients that send a matching
+    ``If-None-Match`` header receive ``304 Not Modified`` with no body.
+    """
+    global _cached_payload, _cached_etag, _cached_version
+
+    if (
+        _cached_payload is None
+        or _cached_etag is None
+        or _cached_version != _registry.version
+    ):
+        _cached_payload = _render_interfaces(_registry)
+        digest = hashlib.blake2b(_cached_payload, digest_size=16).hexdigest()
+        _cached_etag = f'"{digest}"'
+        _cached_version = _registry.version
+    payload: bytes = _cached_payload
+    etag: str = _cached_etag
+
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers=headers,
+    )
@@ -6,6 +6,7 @@ from typing import Any, Dict, List
 import pandas as pd
 from fastapi import APIRouter
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
 from emo.services.metrics import MetricEngine
 
@@ -57,11 +58,15 @@ async def compute_organismality(payload: OrganismalityPayload) -> Dict[str, Any]
     This is a reference endpoint meant for experimentation and integration
     testing. In production deployments you would typically plug this into
     your own treaty/conflict data sources.
+
+    The pandas work is offloaded to the threadpool so that it does not
+    block the event loop for other requests (e.g. `/health`).
     """
     treaties_df = pd.DataFrame(payload.treaties)
     conflicts_df = pd.DataFrame(payload.conflicts)
 
-    result = _engine.organismality_from_frames(
+    result = await run_in_threadpool(
+        _engine.organismality_from_frames,
         treaties_df=treaties_df,
         conflicts_df=conflicts_df,
     )
@@ -1,12 +1,14 @@
 # api/routers/uia.py
 from __future__ import annotations
 
-from dataclasses import asdict
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
-from fastapi import APIRouter
-from pydantic import BaseModel
+from fastapi import APIRouter, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+from starlette.concurrency import run_in_threadpool
 
 from emo.services.metrics import MetricEngine
 
@@ -52,8 +54,16 @@ class UIARequest(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 
-@router.post("/summary")
-async def compute_uia_summary(payload: UIARequest) -> Dict[str, Any]:
+@router.post(
+    "/summary",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": UIARequest.model_json_schema()}},
+        }
+    },
+)
+async def compute_uia_summary(request: Request) -> Dict[str, Any]:
     """
     Compute a UIASummary from scalar R, B and time series C, S, I.
 
@@ -61,32 +71,64 @@ async def compute_uia_summary(payload: UIARequest) -> Dict[str, Any]:
     your C/S/I time series on the client side, estimate R and B for the
     same window, and POST them here to obtain a coarse-grained Ȧ_UIA and
     the corresponding a_UIA(t) series.
+
+    The raw body is parsed and validated in a single pydantic-core pass
+    (``model_validate_json``) rather than via ``json.loads`` followed by
+    model validation, which matters for long C/S/I series. The numerical
+    work runs in the threadpool so that it does not block the event loop.
+    """
+    try:
+        payload = UIARequest.model_validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [
+                {**err, "loc": ("body", *err["loc"])}
+                for err in exc.errors(include_url=False)
+            ]
+        ) from None
+    return await run_in_threadpool(_run_uia_summary, payload)
+
+
+def _run_uia_summary(payload: UIARequest) -> Dict[str, Any]:
+    """
+    Synchronous body of :func:`compute_uia_summary`.
     """
     if not (len(payload.C) == len(payload.S) == len(payload.I)):
         raise ValueError("C, S, and I must have the same length.")
 
-    if payload.timestamps is not None:
-        if len(payload.timestamps) != len(payload.C):
-            raise ValueError("timestamps length must match C/S/I length.")
-        index = pd.to_datetime(payload.timestamps)
-    else:
-        # Simple integer index is fine if timestamps are not provided.
-        index = pd.RangeIndex(len(payload.C))
-
-    C_series = pd.Series(payload.C, index=index)
-    S_series = pd.Series(payload.S, index=index)
-    I_series = pd.Series(payload.I, index=index)
-
-    summary = _engine.uia_from_series(
+    # One (3, N) float64 block for C, S and I instead of three separate
+    # Python-list conversions.
+    values = np.array((payload.C, payload.S, payload.I), dtype=np.float64)
+
+    if payload.timestamps is None:
+        # No index needed: feed the raw values straight to the engine.
+        summary = _engine.uia_from_arrays(
+            interface_id=payload.interface_id,
+            R_scalar=payload.R_scalar,
+            B_scalar=payload.B_scalar,
+            C=values[0],
+            S=values[1],
+            I=values[2],
+            M_E=payload.M_E,
+            metadata=payload.metadata,
+        )
+        return summary.to_dict()
+
+    if len(payload.timestamps) != len(payload.C):
+        raise ValueError("timestamps length must match C/S/I length.")
+    # ISO8601 strings go through pandas' vectorised parser; cache=True
+    # dedupes repeated values.
+    index = pd.to_datetime(payload.timestamps, format="ISO8601", cache=True)
+
+    df = pd.DataFrame(values.T, index=index, columns=("C", "S", "I"), copy=False)
+
+    summary = _engine.uia_from_dataframe(
+        df,
         interface_id=payload.interface_id,
         R_scalar=payload.R_scalar,
         B_scalar=payload.B_scalar,
-        C_series=C_series,
-        S_series=S_series,
-        I_series=I_series,
         M_E=payload.M_E,
         metadata=payload.metadata,
     )
 
-    # Convert dataclass to dict for FastAPI/JSON.
-    return asdict(summary)
+    return summary.to_dict()
@@ -26,6 +26,9 @@ class Settings(BaseSettings):
     undrr_base: str = "https://www.undrr.org"
     wmo_base: str = "https://wmo.int"
 
+    # API backpressure: max concurrent requests per worker (<= 0 disables)
+    max_inflight: int = 32
+
     class Config:
         env_prefix = "EMO_"
         case_sensitive = False
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, Optional
@@ -20,7 +21,7 @@ class InterfaceClass(str, Enum):
     AI_MODEL = "ai_model"
 
 
-@dataclass
+@dataclass(slots=True)
 class Interface:
     """
     Minimal representation of an interface Σ_i in the Interface Registry.
@@ -48,8 +49,21 @@ class InterfaceRegistry:
 
     def __init__(self) -> None:
         self._interfaces: Dict[str, Interface] = {}
+        self._version = 0
         self._bootstrap_defaults()
 
+    @property
+    def version(self) -> int:
+        """
+        Monotonic counter bumped by every :meth:`register` call.
+
+        Consumers can use this to invalidate derived views (e.g. the cached
+        JSON listing served at ``/interfaces``) without diffing the registry
+        contents. Editing a registered :class:`Interface` in place does not
+        bump it; re-register the updated interface to publish the change.
+        """
+        return self._version
+
     def _bootstrap_defaults(self) -> None:
         settings = get_settings()
 
@@ -89,6 +103,7 @@ class InterfaceRegistry:
 
     def register(self, interface: Interface) -> None:
         self._interfaces[interface.id] = interface
+        self._version += 1
 
     def list(self) -> Dict[str, Interface]:
         return dict(self._interfaces)
@@ -99,6 +114,51 @@ class InterfaceRegistry:
 
 # --- Tiny helper clients ----------------------------------------------------
 
+_ASYNC_CLIENT: Optional[httpx.AsyncClient] = None
+_ASYNC_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Return the pooled ``httpx.AsyncClient`` for the running event loop.
+
+    The client is created lazily on first use and reused afterwards, so
+    repeated calls to the same host share TCP/TLS connections instead of
+    paying a handshake per request. Pooled connections are bound to the
+    loop that opened them, so a new client is created whenever the running
+    loop changes (e.g. across separate ``asyncio.run`` calls). Creation
+    involves no ``await``, so concurrent callers on the same event loop
+    cannot race here.
+    """
+    global _ASYNC_CLIENT, _ASYNC_CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if (
+        _ASYNC_CLIENT is None
+        or _ASYNC_CLIENT.is_closed
+        or _ASYNC_CLIENT_LOOP is not loop
+    ):
+        # A client left over from a finished loop cannot be closed from
+        # here; its connections died with that loop, so just replace it.
+        _ASYNC_CLIENT = httpx.AsyncClient(
+            timeout=20,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+        _ASYNC_CLIENT_LOOP = loop
+    return _ASYNC_CLIENT
+
+
+async def close_async_client() -> None:
+    """
+    Close the shared client, if any (e.g. from an application lifespan hook).
+    """
+    global _ASYNC_CLIENT, _ASYNC_CLIENT_LOOP
+    client, loop = _ASYNC_CLIENT, _ASYNC_CLIENT_LOOP
+    _ASYNC_CLIENT = None
+    _ASYNC_CLIENT_LOOP = None
+    # Only a client owned by the current loop can be closed gracefully.
+    if client is not None and loop is asyncio.get_running_loop():
+        await client.aclose()
+
 
 async def fetch_json(url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
@@ -106,8 +166,9 @@ async def fetch_json(url: str, params: Optional[Dict[str, Any]] = None) -> Dict[
 
     Used by ingestion hooks and demo endpoints; in a real deployment
     this should be wrapped with robust retry, rate-limit, and telemetry.
+    Requests go through the shared pooled client (see
+    :func:`get_async_client`).
     """
-    async with httpx.AsyncClient(timeout=20) as client:
-        resp = await client.get(url, params=params)
-        resp.raise_for_status()
-        return resp.json()
+    resp = await get_async_client().get(url, params=params)
+    resp.raise_for_status()
+    return resp.json()
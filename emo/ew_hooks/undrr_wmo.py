@@ -4,11 +4,16 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional
 
 import httpx
+import orjson
 
 from emo.config import get_settings
+from emo.data_sources import get_async_client
 
+# Keys lifted into dedicated fields; everything else goes into metadata.
+_COVERAGE_FIELDS = frozenset(("region", "coverage"))
 
-@dataclass
+
+@dataclass(slots=True)
 class EarlyWarningCoverage:
     """
     Minimal coverage summary for EW4All-style indicators.
@@ -38,13 +43,20 @@ class EarlyWarningClient:
     stable adapter that infra teams can replace or extend.
 
     By default, the base URL is taken from `EMO_UNDRR_BASE` via
-    `emo.config.Settings.undrr_base`.
+    `emo.config.Settings.undrr_base`, and requests go through the shared
+    pooled client from :func:`emo.data_sources.get_async_client` unless a
+    client is injected.
     """
 
-    def __init__(self, base_url: Optional[str] = None, timeout: float = 10.0) -> None:
-        settings = get_settings()
-        self.base_url = base_url or settings.undrr_base
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: float = 10.0,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        self.base_url = base_url or get_settings().undrr_base
         self._timeout = timeout
+        self._client = client
 
     async def fetch_coverage(
         self,
@@ -57,8 +69,9 @@ class EarlyWarningClient:
         Parameters
         ----------
         client:
-            Optional existing httpx.AsyncClient to reuse. If omitted,
-            a temporary client is created and closed for this call.
+            Optional httpx.AsyncClient to use for this call. If omitted,
+            the client given at construction time is used, falling back
+            to the shared pooled client.
         path:
             Path component to append to `base_url`. Defaults to `/emo/coverage`.
 
@@ -67,38 +80,23 @@ class EarlyWarningClient:
         coverages:
             List of EarlyWarningCoverage entries.
         """
-        close_client = False
-        if client is None:
-            client = httpx.AsyncClient(timeout=self._timeout)
-            close_client = True
-
-        try:
-            url = f"{self.base_url.rstrip('/')}{path}"
-            resp = await client.get(url)
-            resp.raise_for_status()
-            payload = resp.json()
-        finally:
-            if close_client:
-                await client.aclose()
-
-        coverages: List[EarlyWarningCoverage] = []
-        for item in payload:
-            region = str(item.get("region", "Unknown"))
-            coverage = float(item.get("coverage", 0.0))
-            meta = {
-                k: str(v)
-                for k, v in item.items()
-                if k not in {"region", "coverage"}
-            }
-            coverages.append(
-                EarlyWarningCoverage(
-                    region=region,
-                    coverage=coverage,
-                    metadata=meta,
-                )
-            )
+        client = client or self._client or get_async_client()
+
+        url = f"{self.base_url.rstrip('/')}{path}"
+        resp = await client.get(url, timeout=self._timeout)
+        resp.raise_for_status()
+        payload = orjson.loads(resp.content)
 
-        return coverages
+        return [
+            EarlyWarningCoverage(
+                region=str(item.get("region", "Unknown")),
+                coverage=float(item.get("coverage", 0.0)),
+                metadata={
+                    k: str(v) for k, v in item.items() if k not in _COVERAGE_FIELDS
+                },
+            )
+            for item in payload
+        ]
 
     async def fetch_demo_coverage(self) -> List[EarlyWarningCoverage]:
         """
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict
 
 import numpy as np
 import pandas as pd
 
 
-@dataclass
+@dataclass(slots=True)
 class GWIResult:
     """
     Result container for Global Workspace Ignition (GWI).
@@ -15,15 +15,67 @@ class GWIResult:
     gwi_series:
         Time-indexed ignition intensity in [0, 1].
     events:
-        List of timestamps where ignition crosses a configurable
-        percentile threshold.
+        Index of the timestamps where ignition crosses a configurable
+        percentile threshold (a ``DatetimeIndex`` for time-indexed
+        streams).
     """
 
     gwi_series: pd.Series
-    events: List[pd.Timestamp]
+    events: pd.Index
     metadata: Dict[str, str]
 
 
+def compute_gwi_series(streams: pd.DataFrame) -> pd.Series:
+    """
+    Compute the GWI ignition-intensity series from attention streams.
+
+    This is the expensive stage of :func:`compute_gwi` (sorting, z-scoring
+    and squashing every stream). Callers that evaluate several ignition
+    percentiles on the same streams can compute it once and pass the
+    result to :func:`detect_ignition_events` for each threshold.
+    """
+    if streams.empty:
+        return pd.Series(dtype=float)
+
+    # One contiguous float64 matrix, z-scored in place; no intermediate frames.
+    index = streams.index
+    arr = np.array(streams.to_numpy(dtype=np.float64), order="C")
+    if not index.is_monotonic_increasing:
+        order = np.argsort(index.to_numpy(), kind="stable")
+        index = index.take(order)
+        arr = arr[order]
+    np.nan_to_num(arr, copy=False, nan=0.0)
+
+    arr -= arr.mean(axis=0)
+    arr /= arr.std(axis=0) + 1e-9
+    composite = arr.mean(axis=1)
+
+    # Squash into [0,1] via logistic
+    gwi_values = 1.0 / (1.0 + np.exp(-composite))
+    return pd.Series(gwi_values, index=index, name="gwi")
+
+
+def detect_ignition_events(
+    gwi_series: pd.Series,
+    ignition_percentile: float = 0.95,
+) -> pd.Index:
+    """
+    Return the timestamps where `gwi_series` reaches the given percentile.
+
+    This is the cheap thresholding stage of :func:`compute_gwi`. The
+    result is a slice of the series index rather than a list, so no
+    per-event ``Timestamp`` objects are created.
+    """
+    if gwi_series.empty:
+        return gwi_series.index[:0]
+
+    # Work on a contiguous float64 buffer and index with a NumPy mask
+    # rather than going through pandas boolean indexing.
+    values = np.ascontiguousarray(gwi_series.to_numpy(dtype=np.float64))
+    threshold = np.quantile(values, ignition_percentile)
+    return gwi_series.index[values >= threshold]
+
+
 def compute_gwi(
     streams: pd.DataFrame,
     ignition_percentile: float = 0.95,
@@ -45,18 +97,10 @@ def compute_gwi(
     """
     if streams.empty:
         empty = pd.Series(dtype=float)
-        return GWIResult(empty, [], {"definition": "empty"})
-
-    df = streams.sort_index().fillna(0.0)
-    z = (df - df.mean()) / (df.std(ddof=0) + 1e-9)
-    composite = z.mean(axis=1)
-
-    # Squash into [0,1] via logistic
-    gwi_values = 1.0 / (1.0 + np.exp(-composite.to_numpy()))
-    gwi_series = pd.Series(gwi_values, index=df.index, name="gwi")
+        return GWIResult(empty, empty.index, {"definition": "empty"})
 
-    threshold = float(np.quantile(gwi_series.to_numpy(), ignition_percentile))
-    events = gwi_series[gwi_series >= threshold].index.to_list()
+    gwi_series = compute_gwi_series(streams)
+    events = detect_ignition_events(gwi_series, ignition_percentile)
 
     return GWIResult(
         gwi_series=gwi_series,
@@ -7,7 +7,7 @@ import numpy as np
 import pandas as pd
 
 
-@dataclass
+@dataclass(slots=True)
 class InfoTimeResult:
     """
     Information-time τ_I result.
@@ -43,16 +43,19 @@ def compute_information_time(skill_series: pd.Series) -> InfoTimeResult:
     improvements over time; we follow the same idea, normalising
     by the time span. 
     """
-    s = skill_series.dropna().astype(float)
-    if s.empty:
+    values = skill_series.to_numpy(dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if values.size == 0:
         return InfoTimeResult(0.0, 0.0, {"definition": "empty"})
 
-    diffs = s.diff().fillna(0.0)
-    pos_increments = diffs.clip(lower=0.0)
-    total_pos = float(pos_increments.sum())
+    # Sum of positive first differences: clamp the diffs at zero in place
+    # and reduce, rather than boolean-indexing into a filtered copy.
+    diffs = np.diff(values)
+    np.maximum(diffs, 0.0, out=diffs)
+    total_pos = float(diffs.sum())
 
     # Normalise by number of steps for a crude τ_I
-    tau_i = total_pos / max(len(s) - 1, 1)
+    tau_i = total_pos / max(values.size - 1, 1)
 
     return InfoTimeResult(
         tau_i=tau_i,
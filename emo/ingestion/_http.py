@@ -0,0 +1,143 @@
+# emo/ingestion/_http.py
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from emo.config import USER_AGENT
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    retries = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retries)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide ``requests.Session`` used by the ingestion pipelines.
+
+    Sharing one session keeps TCP/TLS connections to OWID, Wikimedia and
+    OpenAlex alive across calls, and retries throttled (429) or transient
+    5xx responses with backoff, honouring ``Retry-After``.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _build_session()
+    return _SESSION
+
+
+class ValidatorCache:
+    """
+    Per-URL HTTP cache validators (``ETag`` / ``Last-Modified``) on disk.
+
+    Lets repeated pipeline runs send conditional GETs and skip the body
+    entirely when the remote file has not changed. Entries are kept in a
+    small JSON file mapping ``url -> {"etag", "last_modified", "path"}``;
+    it is safe to share one instance between pipeline worker threads.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            self._entries: Dict[str, Dict[str, str]] = orjson.loads(path.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            self._entries = {}
+
+    def lookup(self, url: str) -> Optional[Dict[str, str]]:
+        """
+        Return the cached entry for ``url`` if its file is still on disk.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is None or not Path(entry["path"]).exists():
+            return None
+        return entry
+
+    def record(self, url: str, resp: requests.Response, target: Path) -> None:
+        entry = {"path": str(target)}
+        if "ETag" in resp.headers:
+            entry["etag"] = resp.headers["ETag"]
+        if "Last-Modified" in resp.headers:
+            entry["last_modified"] = resp.headers["Last-Modified"]
+        with self._lock:
+            if len(entry) == 1:
+                self._entries.pop(url, None)
+            else:
+                self._entries[url] = entry
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_bytes(orjson.dumps(self._entries, option=orjson.OPT_INDENT_2))
+            tmp.replace(self.path)
+
+
+def download_to_file(
+    url: str,
+    target: Path,
+    timeout: float = 60,
+    cache: Optional[ValidatorCache] = None,
+) -> Tuple[Path, bool]:
+    """
+    Stream ``url`` into ``target`` without holding the whole body in memory.
+
+    The body is written in 1 MiB chunks to a ``.part`` file next to the
+    target and moved into place once complete, so an interrupted download
+    never leaves a truncated file at ``target``. ``iter_content`` undoes
+    any gzip/deflate transfer encoding on the way.
+
+    With a ``cache``, the request is made conditional on the validators
+    from the previous download. On ``304 Not Modified`` nothing is written
+    and the path of the previously downloaded copy is returned instead of
+    ``target`` (which may be the same path).
+
+    Returns
+    -------
+    (path, not_modified):
+        Where the current copy lives, and whether the server answered
+        ``304 Not Modified``.
+    """
+    headers: Dict[str, str] = {}
+    cached = cache.lookup(url) if cache is not None else None
+    if cached is not None:
+        if "etag" in cached:
+            headers["If-None-Match"] = cached["etag"]
+        if "last_modified" in cached:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    tmp = target.with_name(target.name + ".part")
+    with get_session().get(url, headers=headers, stream=True, timeout=timeout) as resp:
+        if cached is not None and resp.status_code == 304:
+            return Path(cached["path"]), True
+        resp.raise_for_status()
+        try:
+            with tmp.open("wb") as fh:
+                for chunk in resp.iter_content(chunk_size=1 << 20):
+                    fh.write(chunk)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        tmp.replace(target)
+        if cache is not None:
+            cache.record(url, resp, target)
+    return target, False
@@ -1,20 +1,47 @@
 # emo/ingestion/base.py
 from __future__ import annotations
 
-import json
+import atexit
 import logging
 import os
-from dataclasses import dataclass, asdict
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, is_dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 LOG = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+ArrayT = TypeVar("ArrayT", pd.Series, np.ndarray)
 
-@dataclass
+# Append handles for the ops run logs, one per file, kept open for the
+# life of the process so repeated runs do not pay an open/close each.
+_RUN_LOG_HANDLES: Dict[Path, BinaryIO] = {}
+_RUN_LOG_LOCK = threading.Lock()
+
+
+@dataclass(slots=True)
 class DataLakeLayout:
     """
     Simple on-disk data-lake layout for EMO.
@@ -31,6 +58,13 @@ class DataLakeLayout:
     clean_dir: Path
     feature_dir: Path
     metric_dir: Path
+    # zone name -> attribute holding its directory
+    _ZONE_ATTRS: ClassVar[Dict[str, str]] = {
+        "raw": "raw_dir",
+        "clean": "clean_dir",
+        "feature": "feature_dir",
+        "metric": "metric_dir",
+    }
 
     @classmethod
     def from_env(cls) -> "DataLakeLayout":
@@ -54,20 +88,14 @@ class DataLakeLayout:
         """
         Build a path in a given zone ('raw', 'clean', 'feature', 'metric').
         """
-        if zone == "raw":
-            base = self.raw_dir
-        elif zone == "clean":
-            base = self.clean_dir
-        elif zone == "feature":
-            base = self.feature_dir
-        elif zone == "metric":
-            base = self.metric_dir
-        else:
-            raise ValueError(f"Unknown data-lake zone: {zone}")
-        return base.joinpath(*parts)
-
-
-@dataclass
+        try:
+            attr = self._ZONE_ATTRS[zone]
+        except KeyError:
+            raise ValueError(f"Unknown data-lake zone: {zone}") from None
+        return getattr(self, attr).joinpath(*parts)
+
+
+@dataclass(slots=True)
 class PipelineRun:
     """
     Lightweight record of a single pipeline run.
@@ -79,10 +107,11 @@ class PipelineRun:
     name: str
     started_at: datetime
     finished_at: datetime
-    status: str  # "success", "partial", "failed"
+    status: str  # "success", "partial", "failed", "skipped_unchanged"
     records: Optional[int] = None
     detail: Optional[str] = None
-    artifacts: Optional[Dict[str, str]] = None  # logical_name -> path
+    # logical_name -> path, or list of paths for multi-file outputs
+    artifacts: Optional[Dict[str, Union[str, List[str]]]] = None
 
     @property
     def duration_seconds(self) -> float:
@@ -103,32 +132,208 @@ def ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def save_dataframe(df: pd.DataFrame, path: Path) -> Path:
+def constant_categorical(value: Optional[str], n: int) -> pd.Categorical:
+    """
+    Build a length-``n`` categorical column holding a single repeated label.
+
+    Feature tables repeat their source labels (article, keyword, ...) on
+    every row; as a categorical this costs one int8 code per row and one
+    stored string instead of ``n`` Python string references. ``None``
+    gives an all-missing column.
+    """
+    if value is None:
+        return pd.Categorical.from_codes(np.full(n, -1, dtype=np.int8), categories=[])
+    return pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), categories=[value])
+
+
+def narrow_int(values: ArrayT, dtype: str) -> ArrayT:
+    """
+    Cast integer ``values`` to the narrower ``dtype`` when every value fits.
+
+    Years fit in int16 and daily counts in uint32, which halves or
+    quarters those columns in memory and in Parquet. Out-of-range data is
+    returned unchanged (still int64) rather than silently wrapped.
+    """
+    info = np.iinfo(dtype)
+    if len(values) == 0 or (values.min() >= info.min and values.max() <= info.max):
+        return values.astype(dtype)
+    LOG.warning("Values exceed %s range; keeping %s", dtype, values.dtype)
+    return values
+
+
+def config_metadata(cfg: Any) -> Dict[str, str]:
+    """
+    Flatten a source config dataclass into string metadata for
+    :func:`save_dataframe`, dropping unset (``None``) fields.
+    """
+    if not is_dataclass(cfg) or isinstance(cfg, type):
+        raise TypeError(f"expected a dataclass instance, got {type(cfg).__name__}")
+    return {k: str(v) for k, v in asdict(cfg).items() if v is not None}
+
+
+def save_dataframe(
+    df: pd.DataFrame,
+    path: Path,
+    metadata: Optional[Dict[str, str]] = None,
+) -> Path:
     """
     Save a DataFrame to CSV or Parquet depending on the file extension.
+
+    ``metadata`` (Parquet only) is stored as file-level key/value metadata,
+    e.g. the source config the table was fetched with; read it back with
+    :func:`read_table_metadata` without touching the row data.
+
+    Parquet is the format for the internal zones (clean / feature /
+    metric) and is written with pyarrow and zstd compression; CSV is kept
+    for human-facing exports.
+
+    Integer and timestamp columns (years, counts, dates) are mostly
+    monotonic or slowly varying, so they use DELTA_BINARY_PACKED; every
+    other column is dictionary-encoded, which collapses the per-row
+    repeated labels (article, keyword, concept_id, ...) to a few bytes.
     """
     ensure_parent(path)
     suffix = path.suffix.lower()
     if suffix == ".csv":
         df.to_csv(path, index=False)
     elif suffix in (".parquet", ".pq"):
-        df.to_parquet(path, index=False)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if metadata:
+            table = table.replace_schema_metadata(
+                {
+                    **(table.schema.metadata or {}),
+                    **{k.encode(): v.encode() for k, v in metadata.items()},
+                }
+            )
+        delta_cols = [
+            f.name
+            for f in table.schema
+            if pa.types.is_integer(f.type) or pa.types.is_timestamp(f.type)
+        ]
+        pq.write_table(
+            table,
+            path,
+            compression="zstd",
+            compression_level=3,
+            use_dictionary=[n for n in table.column_names if n not in delta_cols],
+            column_encoding={n: "DELTA_BINARY_PACKED" for n in delta_cols},
+            data_page_size=1 << 20,
+            write_statistics=True,
+        )
     else:
         raise ValueError(f"Unsupported extension for DataFrame save: {suffix}")
     LOG.info("Saved %d rows to %s", len(df), path)
     return path
 
 
+def load_table(path: Path) -> pa.Table:
+    """
+    Read a Parquet file written by :func:`save_dataframe` as an Arrow table.
+
+    The file is memory-mapped, so the compressed pages come straight from
+    the OS page cache (and are shared between worker processes) instead of
+    being read into a private buffer. Numeric feature tables can be used
+    with pyarrow compute directly, skipping pandas materialisation.
+    """
+    with pa.memory_map(str(path), "r") as source:
+        return pq.read_table(source)
+
+
+def read_table_metadata(path: Path) -> Dict[str, str]:
+    """
+    Return the key/value metadata stored by :func:`save_dataframe`.
+
+    Only the Parquet footer is read. pyarrow's own ``pandas`` schema entry
+    is left out.
+    """
+    raw = pq.read_schema(path).metadata or {}
+    return {k.decode(): v.decode() for k, v in raw.items() if k != b"pandas"}
+
+
+def load_dataframe(path: Path) -> pd.DataFrame:
+    """
+    Load a DataFrame written by :func:`save_dataframe`.
+
+    Parquet goes through :func:`load_table`; the Arrow buffers are released
+    column by column while converting to pandas to keep peak memory down.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        return pd.read_csv(path)
+    if suffix in (".parquet", ".pq"):
+        return load_table(path).to_pandas(self_destruct=True)
+    raise ValueError(f"Unsupported extension for DataFrame load: {suffix}")
+
+
+def map_concurrently(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = 8,
+) -> Tuple[List[R], List[str]]:
+    """
+    Apply ``fn`` to every item on a thread pool.
+
+    Ingestion pipelines are dominated by network round-trips, so per-item
+    fetches overlap well on threads. Results come back in input order; an
+    item whose call raises is logged and reported in the second list as
+    ``"<item>: <error>"`` instead of aborting the rest of the batch.
+
+    Equal (hashable) items are only computed once per call and share the
+    result, so a config listed twice does not hit the remote API twice.
+    """
+    items = list(items)
+    results: List[R] = []
+    errors: List[str] = []
+    if not items:
+        return results, errors
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as pool:
+        futures: List[Future] = []
+        by_item: Dict[T, Future] = {}
+        for item in items:
+            try:
+                future = by_item.get(item)
+            except TypeError:  # unhashable items are never deduplicated
+                futures.append(pool.submit(fn, item))
+                continue
+            if future is None:
+                future = by_item[item] = pool.submit(fn, item)
+            futures.append(future)
+
+        for item, future in zip(items, futures, strict=True):
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                LOG.exception("Pipeline item %r failed", item)
+                errors.append(f"{item!r}: {exc}")
+    return results, errors
+
+
+def _close_run_logs() -> None:
+    with _RUN_LOG_LOCK:
+        for handle in _RUN_LOG_HANDLES.values():
+            handle.close()
+        _RUN_LOG_HANDLES.clear()
+
+
+atexit.register(_close_run_logs)
+
+
 def log_pipeline_run(run: PipelineRun, layout: Optional[DataLakeLayout] = None) -> None:
     """
     Append a JSON line describing the pipeline run into metric/ops/ directory.
     """
     layout = layout or DataLakeLayout.from_env()
-    ops_dir = layout.metric_dir / "ops"
-    ops_dir.mkdir(parents=True, exist_ok=True)
-    log_path = ops_dir / f"pipeline_runs_{run.name}.jsonl"
-    with log_path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(run.to_dict()) + "\n")
+    log_path = layout.metric_dir / "ops" / f"pipeline_runs_{run.name}.jsonl"
+    line = orjson.dumps(run.to_dict(), option=orjson.OPT_APPEND_NEWLINE)
+    with _RUN_LOG_LOCK:
+        handle = _RUN_LOG_HANDLES.get(log_path)
+        if handle is None:
+            ensure_parent(log_path)
+            handle = _RUN_LOG_HANDLES[log_path] = log_path.open("ab")
+        handle.write(line)
+        # Flush per record so the line is on disk even if the process dies.
+        handle.flush()
     LOG.info(
         "Pipeline %s finished with status=%s, records=%s, duration=%.2fs",
         run.name,
@@ -2,19 +2,26 @@
 from __future__ import annotations
 
 import logging
+import os
+import shutil
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Union
 
-import requests
-
-from .base import DataLakeLayout, PipelineRun, now_utc, ensure_parent
+from ._http import ValidatorCache, download_to_file
+from .base import (
+    DataLakeLayout,
+    PipelineRun,
+    ensure_parent,
+    log_pipeline_run,
+    now_utc,
+)
 
 LOG = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class ForecastSkillConfig:
     """
     Minimal config for mirroring a forecast-skill CSV into the data lake.
@@ -42,36 +49,53 @@ def run_forecast_skill_pipeline(
     - a timestamped snapshot in raw/forecast_skill/
     - a canonical copy in clean/forecast_skill/{canonical_name}.csv
 
+    The download is conditional on the previous snapshot's ETag /
+    Last-Modified; if the remote file is unchanged no new snapshot is
+    written and the run is reported as ``"skipped_unchanged"``.
+
     Intended cadence: **yearly** (or when new skill series become available).
     """
     layout = layout or DataLakeLayout.from_env()
     started = now_utc()
-    artifacts = {}
+    artifacts: Dict[str, Union[str, List[str]]] = {}
 
     try:
         LOG.info("Downloading forecast skill CSV from %s", cfg.url)
-        resp = requests.get(cfg.url, timeout=timeout)
-        resp.raise_for_status()
-        content = resp.content
-
         ts = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
         raw_path = layout.subpath(
             "raw", "forecast_skill", f"{cfg.canonical_name}_{ts}.csv"
         )
         ensure_parent(raw_path)
-        raw_path.write_bytes(content)
+        cache = ValidatorCache(
+            layout.subpath("raw", "forecast_skill", "http_cache.json")
+        )
+        downloaded, not_modified = download_to_file(
+            cfg.url, raw_path, timeout=timeout, cache=cache
+        )
 
         clean_path = layout.subpath(
             "clean", "forecast_skill", f"{cfg.canonical_name}.csv"
         )
-        ensure_parent(clean_path)
-        clean_path.write_bytes(content)
+        if not_modified:
+            # 304: the previous snapshot (and its clean copy) is current.
+            raw_path = downloaded
+            status = "skipped_unchanged"
+        else:
+            ensure_parent(clean_path)
+            # The clean copy is byte-identical to the snapshot, so hardlink
+            # it (raw snapshots are never modified in place); copy across
+            # devices.
+            clean_path.unlink(missing_ok=True)
+            try:
+                os.link(raw_path, clean_path)
+            except OSError:
+                shutil.copyfile(raw_path, clean_path)
+            status = "success"
 
         artifacts = {
             "raw_csv": str(raw_path),
             "clean_csv": str(clean_path),
         }
-        status = "success"
         detail = None
         records = None  # unknown here; metric layer will parse
     except Exception as exc:  # pragma: no cover - defensive
@@ -90,7 +114,5 @@ def run_forecast_skill_pipeline(
         detail=detail,
         artifacts=artifacts or None,
     )
-    from .base import log_pipeline_run
-
     log_pipeline_run(run, layout=layout)
     return run
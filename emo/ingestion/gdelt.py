@@ -4,11 +4,23 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import date
-from typing import Iterable, List, Optional
+from functools import partial
+from typing import Iterable, List, Optional, Tuple
 
 import pandas as pd
-
-from .base import DataLakeLayout, PipelineRun, now_utc, save_dataframe
+from pandas.tseries.api import guess_datetime_format
+
+from .base import (
+    DataLakeLayout,
+    PipelineRun,
+    config_metadata,
+    constant_categorical,
+    log_pipeline_run,
+    map_concurrently,
+    narrow_int,
+    now_utc,
+    save_dataframe,
+)
 
 LOG = logging.getLogger(__name__)
 
@@ -19,7 +31,7 @@ except ImportError:  # pragma: no cover - optional dependency
     Filters = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class GDELTTopicConfig:
     """
     Configuration for a GDELT DOC 2.0 topic timeline.
@@ -48,6 +60,22 @@ def _require_gdelt_client() -> GdeltDoc:
     return GdeltDoc()
 
 
+def _parse_timestamps(values: pd.Series) -> pd.Series:
+    """
+    Parse a timeline's time column with a single, explicit format.
+
+    GDELT emits one fixed layout per response, so the format is guessed
+    from the first value and applied to the whole column instead of
+    letting pandas infer it per element. Already-parsed columns pass
+    through unchanged.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    first = values.first_valid_index()
+    fmt = guess_datetime_format(str(values[first])) if first is not None else None
+    return pd.to_datetime(values, format=fmt, cache=True)
+
+
 def fetch_timeline_for_topic(cfg: GDELTTopicConfig) -> pd.DataFrame:
     """
     Fetch a TimelineVolRaw timeline for a topic using gdeltdoc.
@@ -80,26 +108,44 @@ def fetch_timeline_for_topic(cfg: GDELTTopicConfig) -> pd.DataFrame:
     else:
         val_col = timeline.columns[1]
 
+    # copy=False: adopt the column buffers built here (and the client's
+    # already-parsed timestamps) instead of copying them into the frame.
     df = pd.DataFrame(
         {
-            "datetime": pd.to_datetime(timeline[time_col]),
-            "count": timeline[val_col].astype("int64"),
-            "topic_label": cfg.label,
-            "keyword": cfg.keyword,
-        }
+            "datetime": _parse_timestamps(timeline[time_col]),
+            "count": narrow_int(timeline[val_col].astype("int64"), "uint32"),
+            "topic_label": constant_categorical(cfg.label, len(timeline)),
+            "keyword": constant_categorical(cfg.keyword, len(timeline)),
+        },
+        copy=False,
     )
-    df.sort_values("datetime", inplace=True)
+    if not df["datetime"].is_monotonic_increasing:
+        df.sort_values("datetime", inplace=True)
     return df
 
 
+def _ingest_topic(cfg: GDELTTopicConfig, layout: DataLakeLayout) -> Tuple[str, int]:
+    """
+    Fetch one topic timeline and save it as a feature table.
+    """
+    df = fetch_timeline_for_topic(cfg)
+    path = layout.subpath("feature", "gdelt", f"timeline_{cfg.label}.parquet")
+    save_dataframe(df, path, metadata=config_metadata(cfg))
+    return str(path), len(df)
+
+
 def run_gdelt_timeline_pipeline(
     topics: Iterable[GDELTTopicConfig],
     layout: Optional[DataLakeLayout] = None,
+    max_workers: int = 8,
 ) -> PipelineRun:
     """
     Fetch GDELT DOC 2.0 timelines for a list of topics and save them as
     feature tables.
 
+    Topics are fetched concurrently; a failed topic is recorded in
+    ``detail`` without stopping the others.
+
     Intended cadence: **daily** (for GWI and daily attention maps).
     """
     layout = layout or DataLakeLayout.from_env()
@@ -108,16 +154,12 @@ def run_gdelt_timeline_pipeline(
     artifacts: List[str] = []
 
     try:
-        for cfg in topics:
-            df = fetch_timeline_for_topic(cfg)
-            records += len(df)
-            path = layout.subpath(
-                "feature", "gdelt", f"timeline_{cfg.label}.parquet"
-            )
-            save_dataframe(df, path)
-            artifacts.append(str(path))
-        status = "success"
-        detail = None
+        ingest = partial(_ingest_topic, layout=layout)
+        results, errors = map_concurrently(ingest, topics, max_workers=max_workers)
+        artifacts = [path for path, _ in results]
+        records = sum(n for _, n in results)
+        status = "success" if not errors else ("partial" if results else "failed")
+        detail = "; ".join(errors) or None
     except Exception as exc:  # pragma: no cover - defensive
         LOG.exception("GDELT pipeline failed: %s", exc)
         status = "failed"
@@ -131,9 +173,7 @@ def run_gdelt_timeline_pipeline(
         status=status,
         records=records,
         detail=detail,
-        artifacts={"feature_paths": ",".join(artifacts)} if artifacts else None,
+        artifacts={"feature_paths": artifacts} if artifacts else None,
     )
-    from .base import log_pipeline_run
-
     log_pipeline_run(run, layout=layout)
     return run
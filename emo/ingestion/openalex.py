@@ -3,12 +3,24 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from functools import partial
+from typing import Iterable, List, Optional, Tuple
 
+import orjson
 import pandas as pd
-import requests
 
-from .base import DataLakeLayout, PipelineRun, now_utc, save_dataframe
+from ._http import get_session
+from .base import (
+    DataLakeLayout,
+    PipelineRun,
+    config_metadata,
+    constant_categorical,
+    log_pipeline_run,
+    map_concurrently,
+    narrow_int,
+    now_utc,
+    save_dataframe,
+)
 
 LOG = logging.getLogger(__name__)
 
@@ -16,7 +28,7 @@ OPENALEX_BASE = "https://api.openalex.org"
 OPENALEX_MAILTO = "mailto=contact@example.org"  # replace with real email for polite use
 
 
-@dataclass
+@dataclass(frozen=True)
 class OpenAlexConceptConfig:
     """
     Configuration for tracking works associated with an OpenAlex concept or topic.
@@ -77,49 +89,64 @@ def fetch_works_by_year(cfg: OpenAlexConceptConfig) -> pd.DataFrame:
 
     url = f"{OPENALEX_BASE}/works"
     LOG.info("Fetching OpenAlex works grouped by year for %s", cfg.label)
-    resp = requests.get(url, params=params, timeout=60)
+    resp = get_session().get(url, params=params, timeout=60)
     resp.raise_for_status()
-    payload = resp.json()
+    payload = orjson.loads(resp.content)
 
     # OpenAlex returns group_by results either under "group_by" or "results"
     groups = payload.get("group_by", []) or payload.get("results", [])
-    years: List[int] = []
-    counts: List[int] = []
-
-    for g in groups:
-        year = g.get("key") or g.get("publication_year")
-        count = g.get("count", 0)
-        try:
-            year_int = int(year)
-        except Exception:
-            # Skip non-integer keys, just in case
-            continue
-        years.append(year_int)
-        counts.append(int(count))
+    raw = pd.DataFrame(groups, columns=["key", "publication_year", "count"])
+
+    # Skip non-integer keys, just in case
+    years = pd.to_numeric(raw["key"].fillna(raw["publication_year"]), errors="coerce")
+    keep = years.notna().to_numpy()
+    n = int(keep.sum())
 
     df = pd.DataFrame(
         {
-            "year": years,
-            "works_count": counts,
-            "label": cfg.label,
-            "concept_id": cfg.concept_id,
-            "display_name_search": cfg.display_name_search,
-            "filter_extra": cfg.filter_extra,
+            "year": narrow_int(years[keep].astype("int64").to_numpy(), "int16"),
+            "works_count": narrow_int(
+                raw["count"][keep].fillna(0).astype("int64").to_numpy(), "uint32"
+            ),
+            "label": constant_categorical(cfg.label, n),
+            "concept_id": constant_categorical(cfg.concept_id, n),
+            "display_name_search": constant_categorical(cfg.display_name_search, n),
+            "filter_extra": constant_categorical(cfg.filter_extra, n),
         }
     ).sort_values("year")
 
     return df.reset_index(drop=True)
 
 
+def _ingest_concept(
+    cfg: OpenAlexConceptConfig,
+    layout: DataLakeLayout,
+) -> Tuple[str, int]:
+    """
+    Fetch one concept's works-by-year counts and save them as a feature table.
+    """
+    df = fetch_works_by_year(cfg)
+    path = layout.subpath(
+        "feature",
+        "openalex",
+        f"works_by_year_{cfg.label}.parquet",
+    )
+    save_dataframe(df, path, metadata=config_metadata(cfg))
+    return str(path), len(df)
+
+
 def openalex_weekly_ingestion(
     concepts: Iterable[OpenAlexConceptConfig],
     layout: Optional[DataLakeLayout] = None,
+    max_workers: int = 8,
 ) -> PipelineRun:
     """
     Weekly pipeline:
 
     - For each configured concept/topic, query OpenAlex /works grouped by year
-      and store a small feature table in the data lake.
+      and store a small feature table in the data lake. Concepts are fetched
+      concurrently; a failed concept is recorded in ``detail`` without
+      stopping the others.
 
     This is intended to be light-weight, cheap to run, and primarily used for
     high-level trend visualisation (e.g. interest in "climate change" or
@@ -133,16 +160,13 @@ def openalex_weekly_ingestion(
     detail: Optional[str] = None
 
     try:
-        for cfg in concepts:
-            df = fetch_works_by_year(cfg)
-            records += len(df)
-            path = layout.subpath(
-                "feature",
-                "openalex",
-                f"works_by_year_{cfg.label}.parquet",
-            )
-            save_dataframe(df, path)
-            artifacts.append(str(path))
+        ingest = partial(_ingest_concept, layout=layout)
+        results, errors = map_concurrently(ingest, concepts, max_workers=max_workers)
+        artifacts = [path for path, _ in results]
+        records = sum(n for _, n in results)
+        if errors:
+            status = "partial" if results else "error"
+            detail = "; ".join(errors)
     except Exception as exc:  # pragma: no cover - defensive
         LOG.exception("OpenAlex weekly ingestion failed")
         status = "error"
@@ -156,10 +180,8 @@ def openalex_weekly_ingestion(
         status=status,
         records=records,
         detail=detail,
-        artifacts={"feature_paths": ",".join(artifacts)} if artifacts else None,
+        artifacts={"feature_paths": artifacts} if artifacts else None,
     )
-    from .base import log_pipeline_run
-
     log_pipeline_run(run, layout=layout)
     return run
 
@@ -3,18 +3,25 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
-
-import requests
-
-from .base import DataLakeLayout, PipelineRun, now_utc, ensure_parent
+from functools import partial
+from typing import Iterable, List, Optional, Tuple
+
+from ._http import ValidatorCache, download_to_file
+from .base import (
+    DataLakeLayout,
+    PipelineRun,
+    ensure_parent,
+    log_pipeline_run,
+    map_concurrently,
+    now_utc,
+)
 
 LOG = logging.getLogger(__name__)
 
 OWID_GRAPHER_BASE = "https://ourworldindata.org/grapher"
 
 
-@dataclass
+@dataclass(frozen=True)
 class OWIDChartConfig:
     """
     Configuration for a single OWID chart to download.
@@ -33,12 +40,30 @@ def download_chart_csv(
     chart: OWIDChartConfig,
     layout: Optional[DataLakeLayout] = None,
     timeout: int = 60,
+    cache: Optional[ValidatorCache] = None,
 ) -> str:
     """
     Download a single OWID chart (CSV) into the raw zone.
 
     The OWID "Chart API" serves CSV/JSON at URLs of the form
     https://ourworldindata.org/grapher/{chart_id}.csv. :contentReference[oaicite:19]{index=19}
+
+    With a ``cache`` the download is conditional, and an unchanged chart
+    keeps its existing file.
+    """
+    path, _ = _fetch_chart_csv(chart, layout=layout, timeout=timeout, cache=cache)
+    return path
+
+
+def _fetch_chart_csv(
+    chart: OWIDChartConfig,
+    layout: Optional[DataLakeLayout] = None,
+    timeout: int = 60,
+    cache: Optional[ValidatorCache] = None,
+) -> Tuple[str, bool]:
+    """
+    Body of :func:`download_chart_csv`; also reports whether the chart was
+    unchanged (``304 Not Modified``).
     """
     layout = layout or DataLakeLayout.from_env()
     url = f"{OWID_GRAPHER_BASE}/{chart.chart_id}.csv"
@@ -46,21 +71,29 @@ def download_chart_csv(
     ensure_parent(target)
 
     LOG.info("Downloading OWID chart %s from %s", chart.chart_id, url)
-    resp = requests.get(url, timeout=timeout)
-    resp.raise_for_status()
-    target.write_bytes(resp.content)
-    LOG.info("Saved OWID chart %s to %s", chart.chart_id, target)
-    return str(target)
+    path, not_modified = download_to_file(url, target, timeout=timeout, cache=cache)
+    if not_modified:
+        LOG.info("OWID chart %s unchanged; keeping %s", chart.chart_id, path)
+    else:
+        LOG.info("Saved OWID chart %s to %s", chart.chart_id, path)
+    return str(path), not_modified
 
 
 def run_owid_pipeline(
     charts: Iterable[OWIDChartConfig],
     layout: Optional[DataLakeLayout] = None,
     timeout: int = 60,
+    max_workers: int = 8,
 ) -> PipelineRun:
     """
     Download a set of OWID charts into the data lake.
 
+    Charts are fetched concurrently (see
+    :func:`emo.ingestion.base.map_concurrently`); a failed chart is
+    recorded in ``detail`` without stopping the others. Downloads are
+    conditional on the ETag / Last-Modified of the previous run, so
+    unchanged charts are not re-fetched.
+
     This should run on a **monthly** cadence for OI / SMF / planetary health.
     """
     layout = layout or DataLakeLayout.from_env()
@@ -69,13 +102,26 @@ def run_owid_pipeline(
     artifacts: List[str] = []
 
     try:
-        for chart in charts:
-            path = download_chart_csv(chart, layout=layout, timeout=timeout)
-            artifacts.append(path)
-            count += 1
-
-        status = "success"
-        detail = None
+        cache = ValidatorCache(layout.subpath("raw", "owid", "http_cache.json"))
+        download = partial(
+            _fetch_chart_csv, layout=layout, timeout=timeout, cache=cache
+        )
+        results, errors = map_concurrently(download, charts, max_workers=max_workers)
+        artifacts = [path for path, _ in results]
+        unchanged = sum(not_modified for _, not_modified in results)
+        # records counts charts actually (re)downloaded in this run
+        count = len(results) - unchanged
+
+        if errors:
+            status = "partial" if results else "failed"
+        elif results and unchanged == len(results):
+            status = "skipped_unchanged"
+        else:
+            status = "success"
+        notes = list(errors)
+        if unchanged:
+            notes.append(f"{unchanged} chart(s) unchanged")
+        detail = "; ".join(notes) or None
     except Exception as exc:  # pragma: no cover - defensive
         LOG.exception("OWID pipeline failed: %s", exc)
         status = "failed"
@@ -89,9 +135,7 @@ def run_owid_pipeline(
         status=status,
         records=count,
         detail=detail,
-        artifacts={"csv_paths": ",".join(artifacts)} if artifacts else None,
+        artifacts={"csv_paths": artifacts} if artifacts else None,
     )
-    from .base import log_pipeline_run
-
     log_pipeline_run(run, layout=layout)
     return run
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 from .base import DataLakeLayout, PipelineRun
@@ -22,6 +23,8 @@ def emo_daily_attention(
 
     - GDELT timelines for a small topic set
     - Wikipedia pageviews for matching articles
+
+    The two sources are fetched concurrently.
     """
     layout = layout or DataLakeLayout.from_env()
 
@@ -53,9 +56,13 @@ def emo_daily_attention(
         ),
     ]
 
-    runs: List[PipelineRun] = []
-    runs.append(run_gdelt_timeline_pipeline(topics, layout=layout))
-    runs.append(run_wikipedia_pageviews_pipeline(wiki_articles, layout=layout))
+    # GDELT and Wikimedia are independent services; run both at once.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [
+            pool.submit(run_gdelt_timeline_pipeline, topics, layout=layout),
+            pool.submit(run_wikipedia_pageviews_pipeline, wiki_articles, layout=layout),
+        ]
+        runs: List[PipelineRun] = [f.result() for f in futures]
     return runs
 
 
@@ -68,6 +75,8 @@ def emo_weekly_synergy(
     - OpenAlex topic timelines for a core set of concepts / topics.
     - OWID charts for complementary macro indicators (planetary boundaries,
       emissions, etc.).
+
+    The two sources are fetched concurrently.
     """
     layout = layout or DataLakeLayout.from_env()
 
@@ -97,9 +106,13 @@ def emo_weekly_synergy(
         OWIDChartConfig(chart_id="ghg-emissions-by-sector"),  # adjust to real IDs
     ]
 
-    runs: List[PipelineRun] = []
-    runs.append(run_openalex_pipeline(concepts, layout=layout))
-    runs.append(run_owid_pipeline(owid_charts, layout=layout))
+    # OpenAlex and OWID are independent services; run both at once.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [
+            pool.submit(run_openalex_pipeline, concepts, layout=layout),
+            pool.submit(run_owid_pipeline, owid_charts, layout=layout),
+        ]
+        runs: List[PipelineRun] = [f.result() for f in futures]
     return runs
 
 
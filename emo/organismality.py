@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
 
+ArrayLike = Union[pd.Series, np.ndarray, Sequence[float]]
+
 
 @dataclass
 class OrganismalityResult:
@@ -21,12 +23,40 @@ class OrganismalityResult:
     regional_oi: Dict[str, float]
     metadata: Dict[str, str]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the result as a plain dict.
+
+        Equivalent to :func:`dataclasses.asdict`, but copies the flat
+        mappings directly instead of recursing into every region entry.
+        """
+        return {
+            "global_oi": self.global_oi,
+            "regional_oi": dict(self.regional_oi),
+            "metadata": dict(self.metadata),
+        }
+
 
-def _safe_norm(series: pd.Series) -> pd.Series:
-    s = series.astype(float).fillna(0.0)
-    if s.max() == s.min():
-        return pd.Series(0.0, index=s.index)
-    return (s - s.min()) / (s.max() - s.min())
+def _safe_norm(values: ArrayLike) -> np.ndarray:
+    """
+    Min-max normalise ``values`` to [0, 1] (NaN counts as 0).
+
+    Works on one float64 copy in place; a constant column maps to zeros.
+    """
+    if isinstance(values, pd.Series):
+        a = values.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    else:
+        a = np.array(values, dtype=np.float64)
+    np.nan_to_num(a, copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf)
+    if a.size == 0:
+        return a
+    lo = a.min()
+    span = a.max() - lo
+    if span == 0:
+        return np.zeros_like(a)
+    a -= lo
+    a /= span
+    return a
 
 
 def compute_organismality_index(
@@ -68,19 +98,56 @@ def compute_organismality_index(
     alliance stability, disinformation shocks, etc. 
     """
 
-    df = (
-        treaties[[region_col, treaties_col]]
-        .merge(conflicts[[region_col, conflicts_col]], on=region_col, how="outer")
-        .fillna(0.0)
-    )
-
-    t_norm = _safe_norm(df[treaties_col])
-    c_norm = _safe_norm(df[conflicts_col])
-
-    oi_region = (t_norm * (1.0 - c_norm)).clip(0.0, 1.0)
-    df["oi"] = oi_region
+    t = treaties.set_index(region_col)[treaties_col]
+    c = conflicts.set_index(region_col)[conflicts_col]
+    if t.index.is_unique and c.index.is_unique:
+        # Align both columns on the sorted region union (what an outer merge
+        # produces) without going through the generic merge machinery.
+        # Regions missing on one side come back as NaN, which _safe_norm
+        # treats as 0.
+        regions = t.index.union(c.index)
+        t = t.reindex(regions)
+        c = c.reindex(regions)
+    else:
+        df = (
+            treaties[[region_col, treaties_col]]
+            .merge(conflicts[[region_col, conflicts_col]], on=region_col, how="outer")
+            .fillna(0.0)
+        )
+        regions = pd.Index(df[region_col])
+        t = df[treaties_col]
+        c = df[conflicts_col]
+
+    return compute_organismality_index_from_arrays(regions, t, c)
+
+
+def compute_organismality_index_from_arrays(
+    regions: Sequence[str],
+    treaties: ArrayLike,
+    conflicts: ArrayLike,
+) -> OrganismalityResult:
+    """
+    Compute the Organismality Index from pre-aligned per-region arrays.
 
-    regional = {r: float(v) for r, v in zip(df[region_col], df["oi"])}
+    ``treaties[i]`` and ``conflicts[i]`` must both refer to ``regions[i]``.
+    Callers that keep region-aligned arrays between calls can use this
+    entry point to skip the join done by
+    :func:`compute_organismality_index`; missing values count as 0.
+    """
+    t_norm = _safe_norm(treaties)
+    c_norm = _safe_norm(conflicts)
+    if not (len(regions) == len(t_norm) == len(c_norm)):
+        raise ValueError("regions, treaties and conflicts must have equal length")
+
+    # OI = t_norm * (1 - c_norm), computed in the normalised buffers
+    np.subtract(1.0, c_norm, out=c_norm)
+    np.multiply(t_norm, c_norm, out=t_norm)
+    oi_region = np.clip(t_norm, 0.0, 1.0, out=t_norm)
+
+    # tolist() unboxes in C; no per-region float() calls
+    if isinstance(regions, (pd.Index, np.ndarray)):
+        regions = regions.tolist()
+    regional = dict(zip(regions, oi_region.tolist()))
 
     # Global OI: mean of regional scores
     global_oi = float(oi_region.mean()) if len(oi_region) else 0.0
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Any, Dict, Tuple
 
+import numpy as np
 import pandas as pd
 
 
@@ -24,6 +25,26 @@ class ReciprocityResult:
     B: float
     metadata: Dict[str, str]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the result as a plain dict (a shallow :func:`dataclasses.asdict`).
+        """
+        return {
+            "R": self.R,
+            "JB": self.JB,
+            "B": self.B,
+            "metadata": dict(self.metadata),
+        }
+
+
+def _nansum_count(values: pd.Series) -> Tuple[float, int]:
+    """
+    Sum and count the non-missing entries of ``values`` in one float64 buffer.
+    """
+    a = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~np.isnan(a)
+    return float(np.sum(a, where=valid)), int(np.count_nonzero(valid))
+
 
 def compute_reciprocity_fluxes(
     buffering_proxy: pd.Series,
@@ -58,13 +79,13 @@ def compute_reciprocity_fluxes(
     This gives a single scalar R > 1 when buffering dominates,
     R < 1 when selection dominates. 
     """
-    bp = buffering_proxy.dropna().astype(float)
-    sp = selection_proxy.dropna().astype(float)
-    if bp.empty or sp.empty:
+    jb_sum, jb_n = _nansum_count(buffering_proxy)
+    b_sum, b_n = _nansum_count(selection_proxy)
+    if jb_n == 0 or b_n == 0:
         return ReciprocityResult(1.0, 0.0, 0.0, {"definition": "empty"})
 
-    JB = float(bp.mean())
-    B = float(sp.mean())
+    JB = jb_sum / jb_n
+    B = b_sum / b_n
     eps = 1e-9
     R = JB / max(B, eps) if B > 0 else float("inf")
 
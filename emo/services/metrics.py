@@ -2,43 +2,86 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass, is_dataclass
+from functools import singledispatch
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from emo.organismality import compute_organismality_index
 from emo.smf import compute_smf
-from emo.uia_engine import UIACoefficients, UIASnapshot, compute_a_uia
+from emo.uia_engine import (
+    UIACoefficients,
+    UIASnapshot,
+    compute_a_uia,
+    compute_a_uia_array,
+)
 
 
+@singledispatch
 def _result_to_dict(result: Any) -> Any:
     """
     Best-effort conversion of metric results into JSON-friendly structures.
 
     This helper keeps the service layer and API endpoints decoupled from the
     concrete return types of the scientific core (dataclasses, pandas objects,
-    etc.).
+    etc.). Conversions are dispatched on ``type(result)``; dataclasses, which
+    share no common base class, are handled here in the fallback.
     """
-    # Dataclasses (used throughout emo.*)
+    # Dataclasses (used throughout emo.*). Flat result types provide a
+    # shallow to_dict(); asdict() deep-copies every nested value, which
+    # dominates the cost for large per-region mappings.
     if is_dataclass(result) and not isinstance(result, type):
-        return asdict(result)
+        to_dict = getattr(result, "to_dict", None)
+        return to_dict() if to_dict is not None else asdict(result)
 
-    # Common pandas containers
-    if isinstance(result, pd.DataFrame):
-        return result.to_dict(orient="records")
+    # Fallback: assume it is already JSON-serialisable
+    return result
 
-    if isinstance(result, pd.Series):
-        return result.to_dict()
 
-    # Generic containers
-    if isinstance(result, dict):
-        return {k: _result_to_dict(v) for k, v in result.items()}
+# Common pandas containers
+@_result_to_dict.register
+def _(result: pd.DataFrame) -> Any:
+    return result.to_dict(orient="records")
 
-    if isinstance(result, (list, tuple)):
-        return [_result_to_dict(v) for v in result]
 
-    # Fallback: assume it is already JSON-serialisable
-    return result
+@_result_to_dict.register
+def _(result: pd.Series) -> Any:
+    return result.to_dict()
+
+
+# Generic containers
+@_result_to_dict.register
+def _(result: dict) -> Any:
+    return {k: _result_to_dict(v) for k, v in result.items()}
+
+
+@_result_to_dict.register(list)
+@_result_to_dict.register(tuple)
+def _(result: Any) -> Any:
+    return [_result_to_dict(v) for v in result]
+
+
+def _index_labels(index: pd.Index) -> List[str]:
+    """
+    Render index labels as strings, matching ``[str(ts) for ts in index]``.
+
+    Formatting is vectorised only for the index types whose rendering is
+    known to match ``str``: datetimes and ``RangeIndex``.
+    ``DatetimeIndex.astype(str)`` drops the time of day when every timestamp
+    is at midnight, so whole-second naive datetimes are formatted explicitly;
+    sub-second datetimes and all other index types (e.g. ``TimedeltaIndex``,
+    whose vectorised form is abbreviated) fall back to per-element ``str``.
+    """
+    if isinstance(index, pd.DatetimeIndex):
+        if not ((index.microsecond == 0) & (index.nanosecond == 0)).all():
+            return [str(ts) for ts in index]
+        if index.tz is None:
+            return index.strftime("%Y-%m-%d %H:%M:%S").tolist()
+        return index.astype(str).tolist()
+    if isinstance(index, pd.RangeIndex):
+        return index.astype(str).tolist()
+    return [str(label) for label in index]
 
 
 # ---------------------------------------------------------------------------
@@ -46,7 +89,7 @@ def _result_to_dict(result: Any) -> Any:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class UIASummary:
     """
     JSON-serialisable summary of a UIA aggregation.
@@ -81,18 +124,31 @@ class UIASummary:
         metadata:
             Optional extra metadata to attach to the summary.
         """
-        index = snapshot.a_uia_series.index
-        a_values = [float(v) for v in snapshot.a_uia_series.to_numpy()]
-        timestamps = [str(ts) for ts in index]
+        a_values = snapshot.a_uia_series.to_numpy(dtype=np.float64).tolist()
 
         return cls(
             interface_id=interface_id,
             A_uia_bar=float(snapshot.A_uia_bar),
             a_uia=a_values,
-            timestamps=timestamps,
+            timestamps=_index_labels(snapshot.a_uia_series.index),
             metadata=metadata or {},
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the summary as a plain dict for JSON responses.
+
+        Unlike :func:`dataclasses.asdict` this does not recurse into (and
+        deep-copy) the value lists; the fields are already JSON-friendly.
+        """
+        return {
+            "interface_id": self.interface_id,
+            "A_uia_bar": self.A_uia_bar,
+            "a_uia": self.a_uia,
+            "timestamps": self.timestamps,
+            "metadata": self.metadata,
+        }
+
 
 # ---------------------------------------------------------------------------
 # Metric engine
@@ -246,10 +302,11 @@ class MetricEngine:
         """
         Compute UIA metrics from scalar R, B and time series C, S, I.
 
-        This is the main entry point used by the tests and the FastAPI
-        `/uia/summary` endpoint. It delegates the numerical work to
-        :func:`emo.uia_engine.compute_a_uia` and packages the result as a
-        :class:`UIASummary`.
+        This is the general entry point for indexed series. It delegates the
+        numerical work to :func:`emo.uia_engine.compute_a_uia` and packages
+        the result as a :class:`UIASummary`. The FastAPI `/uia/summary`
+        endpoint reaches it through :meth:`uia_from_dataframe` when
+        timestamps are supplied, and uses :meth:`uia_from_arrays` otherwise.
         """
         snapshot = compute_a_uia(
             R_scalar=R_scalar,
@@ -267,6 +324,42 @@ class MetricEngine:
             metadata=metadata,
         )
 
+    def uia_from_arrays(
+        self,
+        interface_id: str,
+        R_scalar: float,
+        B_scalar: float,
+        C: np.ndarray,
+        S: np.ndarray,
+        I: np.ndarray,
+        M_E: float,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> UIASummary:
+        """
+        Compute UIA metrics from plain arrays, without building pandas objects.
+
+        Fast path for callers that have no timestamps: the C, S and I values
+        are treated as evenly spaced samples on an integer index, exactly as
+        :meth:`uia_from_series` would with a ``RangeIndex``.
+        """
+        a_values, A_uia_bar = compute_a_uia_array(
+            R_scalar=R_scalar,
+            B_scalar=B_scalar,
+            C=C,
+            S=S,
+            I=I,
+            M_E=M_E,
+            coeffs=self._uia_coeffs,
+        )
+
+        return UIASummary(
+            interface_id=interface_id,
+            A_uia_bar=A_uia_bar,
+            a_uia=a_values.tolist(),
+            timestamps=[str(i) for i in range(len(a_values))],
+            metadata=metadata or {},
+        )
+
     def uia_from_dataframe(
         self,
         df: pd.DataFrame,
@@ -335,21 +428,16 @@ class MetricEngine:
         dependence on R explicit.
         """
         # Ensure the series share the same index; compute_a_uia will perform
-        # the actual consistency checks.
-        C_series = C_series.copy()
-        C_series.index = index
-        S_series = S_series.copy()
-        S_series.index = index
-        I_series = I_series.copy()
-        I_series.index = index
-
+        # the actual consistency checks. set_axis relabels without copying
+        # the values (copy-on-write) and, like index assignment, raises on a
+        # length mismatch.
         return self.uia_from_series(
             interface_id=interface_id,
             R_scalar=1.0,  # neutral curvature placeholder
             B_scalar=B_scalar,
-            C_series=C_series,
-            S_series=S_series,
-            I_series=I_series,
+            C_series=C_series.set_axis(index),
+            S_series=S_series.set_axis(index),
+            I_series=I_series.set_axis(index),
             M_E=M_E,
             metadata=metadata,
         )
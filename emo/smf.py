@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Tuple
 
 import numpy as np
 import pandas as pd
@@ -24,6 +24,102 @@ class SMFResult:
     metadata: Dict[str, str]
 
 
+def _lagged_correlations(
+    model_vals: np.ndarray,
+    real_vals: np.ndarray,
+    max_lag: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pearson correlation between `model_vals` and `real_vals` at every lag
+    in [-max_lag, max_lag] with at least two overlapping points.
+
+    A positive lag pairs model[t] with realised[t + lag]. All lags are
+    evaluated in one pass: cross-products come from a single
+    ``np.correlate`` call and per-window sums from prefix sums, instead of
+    one ``np.corrcoef`` allocation per lag.
+    """
+    n = len(model_vals)
+    max_lag = min(max_lag, n - 2)
+    if max_lag < 0:
+        return np.empty(0, dtype=int), np.empty(0, dtype=float)
+
+    # Centre globally to limit cancellation in the sum-of-squares formulas.
+    x = model_vals - model_vals.mean()
+    y = real_vals - real_vals.mean()
+
+    lags = np.arange(-max_lag, max_lag + 1)
+    k = np.abs(lags)
+    count = n - k
+    x_start = np.where(lags < 0, k, 0)
+    y_start = np.where(lags > 0, k, 0)
+
+    def _window_sums(v: np.ndarray, start: np.ndarray) -> np.ndarray:
+        prefix = np.concatenate(([0.0], np.cumsum(v)))
+        return prefix[start + count] - prefix[start]
+
+    sx = _window_sums(x, x_start)
+    sy = _window_sums(y, y_start)
+    sxx = _window_sums(x * x, x_start)
+    syy = _window_sums(y * y, y_start)
+    sxy = _window_cross_sums(x, y, x_start, y_start, count)
+
+    cov = sxy - sx * sy / count
+    var_x = sxx - sx * sx / count
+    var_y = syy - sy * sy / count
+    # Constant windows have zero variance (undefined correlation, as with
+    # np.corrcoef); the sum-of-squares formula can leave rounding residue
+    # there, so treat variances that small relative to the window's second
+    # moment as zero.
+    tol = 1e-10
+    var_x = np.where(var_x > tol * sxx, var_x, 0.0)
+    var_y = np.where(var_y > tol * syy, var_y, 0.0)
+    denom = np.sqrt(var_x * var_y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corrs = np.where(denom > 0, cov / denom, np.nan)
+
+    # Two-point windows (at most the two outermost lags) always correlate
+    # at exactly +-1 up to rounding, so the lag they select is decided by
+    # rounding alone. Evaluate them with np.corrcoef as the per-lag loop
+    # did, so those ties resolve the same way.
+    for i in np.flatnonzero(count == 2):
+        m = model_vals[x_start[i] : x_start[i] + 2]
+        r = real_vals[y_start[i] : y_start[i] + 2]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corrs[i] = np.corrcoef(m, r)[0, 1]
+    return lags, np.clip(corrs, -1.0, 1.0)
+
+
+def _window_cross_sums(
+    x: np.ndarray,
+    y: np.ndarray,
+    x_start: np.ndarray,
+    y_start: np.ndarray,
+    count: np.ndarray,
+) -> np.ndarray:
+    """
+    ``sum(x[x_start:x_start+count] * y[y_start:y_start+count])`` per lag.
+
+    A full ``np.correlate`` is O(n^2) however few lags are kept, so it is
+    only used when the requested lags cover most of the series; otherwise
+    each window gets its own dot product, which is O(n * n_lags).
+    """
+    n = len(x)
+    if n <= 4 * len(count):
+        # np.correlate(y, x, "full")[s + n - 1] == sum_j y[j + s] * x[j]
+        lags = y_start - x_start
+        return np.correlate(y, x, mode="full")[lags + n - 1]
+    return np.fromiter(
+        (
+            np.dot(x[a : a + c], y[b : b + c])
+            for a, b, c in zip(
+                x_start.tolist(), y_start.tolist(), count.tolist(), strict=True
+            )
+        ),
+        dtype=np.float64,
+        count=len(count),
+    )
+
+
 def compute_smf(
     model: pd.Series,
     realised: pd.Series,
@@ -63,25 +159,18 @@ def compute_smf(
     # Map lag in days to integer steps assuming regular spacing
     n = len(df)
     max_lag = min(max_lag_days, n - 1)
+    lags, corrs = _lagged_correlations(model_vals, real_vals, max_lag)
+
+    # Keep the first lag with the highest correlation, ignoring undefined
+    # (zero-variance) windows and windows shorter than two points.
     best_corr = -1.0
     best_lag = 0
-
-    for lag in range(-max_lag, max_lag + 1):
-        if lag < 0:
-            m = model_vals[-lag:]
-            r = real_vals[: len(m)]
-        elif lag > 0:
-            m = model_vals[: n - lag]
-            r = real_vals[lag:]
-        else:
-            m = model_vals
-            r = real_vals
-        if len(m) < 2:
-            continue
-        corr = float(np.corrcoef(m, r)[0, 1])
-        if corr > best_corr:
-            best_corr = corr
-            best_lag = lag
+    if corrs.size:
+        candidates = np.where(np.isfinite(corrs), corrs, -np.inf)
+        best = int(np.argmax(candidates))
+        if candidates[best] > best_corr:
+            best_corr = float(candidates[best])
+            best_lag = int(lags[best])
 
     smf_score = (best_corr + 1.0) / 2.0 if best_corr > -1 else 0.0
 
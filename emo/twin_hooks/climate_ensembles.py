@@ -61,21 +61,24 @@ def ensemble_from_dataframe(
     if metadata_cols is None:
         metadata_cols = []
 
-    members: List[ClimateEnsembleMember] = []
-
-    for _, row in df.iterrows():
-        parameters = {name: float(row[name]) for name in parameter_cols}
-        score = float(row[score_col])
-        metadata = {name: str(row[name]) for name in metadata_cols}
-        members.append(
-            ClimateEnsembleMember(
-                parameters=parameters,
-                score=score,
-                metadata=metadata,
-            )
+    parameter_cols = list(parameter_cols)
+    metadata_cols = list(metadata_cols)
+
+    # Convert whole columns at once rather than boxing every cell through
+    # ``DataFrame.iterrows``.
+    param_rows = df[parameter_cols].to_numpy(dtype=float).tolist()
+    scores = df[score_col].to_numpy(dtype=float).tolist()
+    meta_columns = [[str(v) for v in df[name].tolist()] for name in metadata_cols]
+    meta_rows = zip(*meta_columns, strict=True) if meta_columns else ([()] * len(df))
+
+    return [
+        ClimateEnsembleMember(
+            parameters=dict(zip(parameter_cols, values, strict=True)),
+            score=score,
+            metadata=dict(zip(metadata_cols, meta, strict=True)),
         )
-
-    return members
+        for values, score, meta in zip(param_rows, scores, meta_rows, strict=True)
+    ]
 
 
 def prepare_ensemble_for_information_geometry(
@@ -19,6 +19,7 @@ from .aggregate import (
     UIASnapshot,
     UIATerms,
     compute_a_uia,
+    compute_a_uia_array,
     default_uia_coefficients,
 )
 
@@ -27,5 +28,6 @@ __all__ = [
     "UIATerms",
     "UIASnapshot",
     "compute_a_uia",
+    "compute_a_uia_array",
     "default_uia_coefficients",
 ]
@@ -30,7 +30,7 @@ paper rather than squeezing out every last bit of performance.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -148,6 +148,84 @@ def _ensure_series_like(x: float | pd.Series, index: pd.Index) -> pd.Series:
     return pd.Series(float(x), index=index)
 
 
+def _forward_diff(x: np.ndarray) -> np.ndarray:
+    """
+    Discrete-time derivative with the first point (and any NaN gap) set to 0.
+
+    Equivalent to ``pd.Series(x).diff().fillna(0.0)`` on a float array.
+    """
+    d = np.zeros_like(x)
+    np.subtract(x[1:], x[:-1], out=d[1:])
+    d[np.isnan(d)] = 0.0
+    return d
+
+
+def compute_a_uia_array(
+    R_scalar: float,
+    B_scalar: float,
+    C: np.ndarray,
+    S: np.ndarray,
+    I: np.ndarray,
+    M_E: float | np.ndarray,
+    coeffs: Optional[UIACoefficients] = None,
+) -> Tuple[np.ndarray, float]:
+    """
+    Compute a_UIA(t) and Ȧ_UIA from plain float arrays.
+
+    This is the numerical kernel behind :func:`compute_a_uia`. It skips
+    all pandas index handling, so callers that only have raw values (e.g.
+    an API payload without timestamps) can avoid building Series.
+
+    Parameters
+    ----------
+    R_scalar, B_scalar:
+        Scalar informational curvature and focusing bracket.
+    C, S, I:
+        Equal-length float arrays for coherence, entropy and information.
+    M_E:
+        Semantic efficiency, as a scalar or an array aligned with C.
+    coeffs:
+        Optional UIACoefficients to use. If omitted, defaults are used.
+
+    Returns
+    -------
+    (a_uia, A_uia_bar):
+        The local density a_UIA(t) as an array and its window mean.
+    """
+    if coeffs is None:
+        coeffs = default_uia_coefficients()
+
+    C = np.asarray(C, dtype=np.float64)
+    S = np.asarray(S, dtype=np.float64)
+    I = np.asarray(I, dtype=np.float64)
+    if not (C.shape == S.shape == I.shape):
+        raise ValueError("C, S, and I must have the same length.")
+
+    # Discrete-time derivatives (simple forward differences; first point = 0).
+    dC = _forward_diff(C)
+    dS = _forward_diff(S)
+    dI = _forward_diff(I)
+
+    # Scalar pieces broadcast across the window.
+    R_term = coeffs.alpha * float(R_scalar)
+    B_term = coeffs.beta * (coeffs.ell**2) * float(B_scalar)
+    M_term = coeffs.eta * (np.asarray(M_E, dtype=np.float64) / coeffs.M0)
+
+    # Assemble a_UIA(t) from the normalized rates.
+    a_uia_values = (
+        R_term
+        + B_term
+        + coeffs.gamma * coeffs.tau_c * dC
+        + coeffs.delta * (dS / coeffs.S0)
+        + coeffs.epsilon * (dI / coeffs.I0)
+        + M_term
+    )
+
+    # Coarse-grained Ȧ_UIA (simple mean over the window).
+    A_uia_bar = float(np.nanmean(a_uia_values))
+    return a_uia_values, A_uia_bar
+
+
 def compute_a_uia(
     R_scalar: float,
     B_scalar: float,
@@ -200,36 +278,17 @@ def compute_a_uia(
     # Promote M_E to a Series.
     M_E_series = _ensure_series_like(M_E_scalar, index=index)
 
-    # Discrete-time derivatives (simple forward differences; first point = 0).
-    dC = C_series.diff().fillna(0.0)
-    dS = S_series.diff().fillna(0.0)
-    dI = I_series.diff().fillna(0.0)
-
-    # Normalized rates.
-    dC_term = coeffs.gamma * coeffs.tau_c * dC
-    dS_term = coeffs.delta * (dS / coeffs.S0)
-    dI_term = coeffs.epsilon * (dI / coeffs.I0)
-
-    # Scalar pieces broadcast across the window.
-    R_term = coeffs.alpha * float(R_scalar)
-    B_term = coeffs.beta * (coeffs.ell**2) * float(B_scalar)
-    M_term = coeffs.eta * (M_E_series / coeffs.M0)
-
-    # Assemble a_UIA(t).
-    # Note: R_term and B_term are scalars; numpy broadcasting handles them.
-    a_uia_values = (
-        R_term
-        + B_term
-        + dC_term.to_numpy()
-        + dS_term.to_numpy()
-        + dI_term.to_numpy()
-        + M_term.to_numpy()
+    a_uia_values, A_uia_bar = compute_a_uia_array(
+        R_scalar=R_scalar,
+        B_scalar=B_scalar,
+        C=C_series.to_numpy(dtype=np.float64),
+        S=S_series.to_numpy(dtype=np.float64),
+        I=I_series.to_numpy(dtype=np.float64),
+        M_E=M_E_series.to_numpy(dtype=np.float64),
+        coeffs=coeffs,
     )
     a_uia_series = pd.Series(a_uia_values, index=index)
 
-    # Coarse-grained Ȧ_UIA (simple mean over the window).
-    A_uia_bar = float(np.nanmean(a_uia_series.to_numpy()))
-
     terms = UIATerms(
         R_scalar=float(R_scalar),
         B_scalar=float(B_scalar),
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.main import app as main_app
+from api.routers import interfaces
+
+
+app = FastAPI()
+app.include_router(interfaces.router, prefix="/interfaces")
+client = TestClient(app)
+
+
+def test_list_interfaces_etag_roundtrip() -> None:
+    """
+    The listing carries an ETag, and replaying it via If-None-Match
+    short-circuits to 304 Not Modified with an empty body.
+    """
+    first = client.get("/interfaces/")
+    assert first.status_code == 200
+    assert "gdelt-doc" in first.json()
+
+    etag = first.headers["etag"]
+    second = client.get("/interfaces/", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+
+def test_interfaces_mounted_on_main_app() -> None:
+    response = TestClient(main_app).get("/interfaces/")
+    assert response.status_code == 200
+    assert "openalex" in response.json()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from api.main import app
+
+
+client = TestClient(app)
+
+
+def test_organismality_endpoint_smoke() -> None:
+    """
+    End-to-end smoke test for the /metrics/organismality endpoint.
+
+    Posts tiny treaty/conflict records and checks that the response
+    mirrors the OrganismalityResult structure.
+    """
+    payload = {
+        "treaties": [
+            {"region": "A", "treaty_count": 10},
+            {"region": "B", "treaty_count": 5},
+            {"region": "C", "treaty_count": 0},
+        ],
+        "conflicts": [
+            {"region": "A", "conflict_deaths": 0},
+            {"region": "B", "conflict_deaths": 10},
+            {"region": "C", "conflict_deaths": 20},
+        ],
+    }
+
+    response = client.post("/metrics/organismality", json=payload)
+    assert response.status_code == 200
+
+    data = response.json()
+    assert set(data.keys()) == {"global_oi", "regional_oi", "metadata"}
+    assert 0.0 <= data["global_oi"] <= 1.0
+    assert set(data["regional_oi"].keys()) == {"A", "B", "C"}
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.middleware import InflightLimitMiddleware, LatencyStatsMiddleware
+
+
+def _build_app(max_inflight: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/slow")
+    async def slow() -> dict:
+        await asyncio.sleep(0.1)
+        return {"status": "ok"}
+
+    @app.get("/health")
+    async def health() -> dict:
+        return {"status": "ok"}
+
+    app.add_middleware(InflightLimitMiddleware, max_inflight=max_inflight)
+    return app
+
+
+def test_inflight_limit_rejects_excess_requests() -> None:
+    """
+    With a limit of two, concurrent requests beyond the cap get a 503 with
+    Retry-After, while the exempt health check still succeeds.
+    """
+    app = _build_app(max_inflight=2)
+
+    async def run() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+            return await asyncio.gather(
+                *(c.get("/slow") for _ in range(4)),
+                c.get("/health"),
+            )
+
+    responses = asyncio.run(run())
+    codes = [r.status_code for r in responses[:4]]
+
+    assert codes.count(200) == 2
+    assert codes.count(503) == 2
+    assert all(r.headers["retry-after"] == "1" for r in responses[:4] if r.status_code == 503)
+    assert responses[4].status_code == 200
+
+
+def test_latency_stats_flush_per_route_batch() -> None:
+    """
+    Latency samples are summarised once a route's batch is full, keyed by
+    the route template rather than the raw path.
+    """
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int) -> dict:
+        return {"id": item_id}
+
+    app.add_middleware(
+        LatencyStatsMiddleware, batch_size=3, flush_interval_seconds=3600.0
+    )
+
+    async def run() -> None:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+            for i in range(3):
+                await c.get(f"/items/{i}")
+
+    asyncio.run(run())
+
+    middleware = app.middleware_stack
+    while not isinstance(middleware, LatencyStatsMiddleware):
+        middleware = middleware.app
+    summary = middleware.last_summary["/items/{item_id}"]
+    assert summary["count"] == 3.0
+    assert summary["p50_ms"] <= summary["p99_ms"]
+
+
+def test_latency_stats_flush_at_shutdown() -> None:
+    """
+    Samples still buffered when the application shuts down are reported.
+    """
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> dict:
+        return {"status": "ok"}
+
+    app.add_middleware(
+        LatencyStatsMiddleware, batch_size=1024, flush_interval_seconds=3600.0
+    )
+
+    with TestClient(app) as client:
+        client.get("/ping")
+        client.get("/ping")
+        middleware = app.middleware_stack
+        while not isinstance(middleware, LatencyStatsMiddleware):
+            middleware = middleware.app
+        assert middleware.last_summary == {}
+
+    assert middleware.last_summary["/ping"]["count"] == 2.0
@@ -57,3 +57,21 @@ def test_uia_summary_endpoint_smoke() -> None:
     assert len(data["a_uia"]) == len(payload["C"])
     assert isinstance(data["metadata"], dict)
     assert data["metadata"].get("lab") == "api-smoke"
+
+
+def test_uia_summary_endpoint_rejects_invalid_body() -> None:
+    """
+    Validation errors from the raw-body parser still surface as 422s.
+    """
+    payload = {
+        "interface_id": "test_interface",
+        "R_scalar": 1.0,
+        "B_scalar": 1.0,
+        "C": [0.2, 0.3],
+        "S": [1.0, "not-a-number"],
+        "I": [0.1, 0.2],
+    }
+
+    response = client.post("/uia/summary", json=payload)
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "S", 1]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from emo.data_sources import close_async_client, fetch_json, get_async_client
+
+
+class _JSONHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so pooled connections persist
+
+    def do_GET(self) -> None:
+        body = json.dumps({"ok": True}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+def test_fetch_json_across_event_loops() -> None:
+    """
+    The shared client is rebuilt for each event loop, so consecutive
+    ``asyncio.run`` calls keep working.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JSONHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    try:
+        for _ in range(3):
+            assert asyncio.run(fetch_json(url)) == {"ok": True}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_async_client_is_shared_within_a_loop() -> None:
+    async def _check() -> None:
+        client = get_async_client()
+        assert get_async_client() is client
+        await close_async_client()
+        assert client.is_closed
+
+    asyncio.run(_check())
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from emo.gwi import compute_gwi, compute_gwi_series, detect_ignition_events
+
+
+def test_compute_gwi_basic() -> None:
+    """
+    GWI values live in [0, 1] and the top-percentile spike is flagged as
+    an ignition event.
+    """
+    index = pd.date_range("2025-01-01", periods=30, freq="D")
+    rng = np.random.default_rng(0)
+    streams = pd.DataFrame(
+        {
+            "news": rng.normal(size=len(index)),
+            "pageviews": rng.normal(size=len(index)),
+        },
+        index=index,
+    )
+    streams.iloc[10] = 10.0
+
+    result = compute_gwi(streams, ignition_percentile=0.95)
+
+    assert len(result.gwi_series) == len(index)
+    assert ((result.gwi_series >= 0.0) & (result.gwi_series <= 1.0)).all()
+    assert isinstance(result.events, pd.DatetimeIndex)
+    assert index[10] in result.events
+
+
+def test_detect_ignition_events_reuses_series() -> None:
+    """
+    Thresholding a precomputed series matches the one-shot computation.
+    """
+    index = pd.date_range("2025-01-01", periods=20, freq="D")
+    streams = pd.DataFrame({"a": np.arange(20.0), "b": np.arange(20.0)}, index=index)
+
+    gwi_series = compute_gwi_series(streams)
+    for pct in (0.5, 0.9):
+        expected = compute_gwi(streams, ignition_percentile=pct).events
+        assert detect_ignition_events(gwi_series, pct).equals(expected)
+
+
+def test_compute_gwi_empty() -> None:
+    result = compute_gwi(pd.DataFrame())
+    assert result.gwi_series.empty
+    assert len(result.events) == 0
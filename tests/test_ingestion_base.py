@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+import pytest
+
+from emo.ingestion.base import (
+    DataLakeLayout,
+    PipelineRun,
+    config_metadata,
+    constant_categorical,
+    load_dataframe,
+    load_table,
+    log_pipeline_run,
+    map_concurrently,
+    narrow_int,
+    now_utc,
+    read_table_metadata,
+    save_dataframe,
+)
+
+
+def test_save_and_load_dataframe_roundtrip(tmp_path: Path) -> None:
+    """
+    Parquet and CSV outputs written by save_dataframe read back unchanged.
+    """
+    df = pd.DataFrame(
+        {
+            "year": [2020, 2021, 2022],
+            "works_count": [10, 12, 15],
+            "label": ["climate_change"] * 3,
+        }
+    )
+
+    for name in ("table.parquet", "table.csv"):
+        path = save_dataframe(df, tmp_path / "feature" / name)
+        loaded = load_dataframe(path)
+        assert loaded["year"].tolist() == df["year"].tolist()
+        assert loaded["works_count"].tolist() == df["works_count"].tolist()
+        assert loaded["label"].tolist() == df["label"].tolist()
+
+    table = load_table(tmp_path / "feature" / "table.parquet")
+    assert table.column_names == ["year", "works_count", "label"]
+    assert table.num_rows == 3
+
+
+def test_log_pipeline_run_appends_json_lines(tmp_path: Path) -> None:
+    layout = DataLakeLayout(
+        root=tmp_path,
+        raw_dir=tmp_path / "raw",
+        clean_dir=tmp_path / "clean",
+        feature_dir=tmp_path / "feature",
+        metric_dir=tmp_path / "metric",
+    )
+    for status in ("success", "failed"):
+        ts = now_utc()
+        log_pipeline_run(
+            PipelineRun(
+                name="demo",
+                started_at=ts,
+                finished_at=ts,
+                status=status,
+                artifacts={"feature_paths": ["a,1.parquet", "b.parquet"]},
+            ),
+            layout=layout,
+        )
+
+    log_path = tmp_path / "metric" / "ops" / "pipeline_runs_demo.jsonl"
+    lines = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert [line["status"] for line in lines] == ["success", "failed"]
+    assert lines[0]["started_at"] == lines[0]["finished_at"]
+    assert lines[0]["artifacts"]["feature_paths"] == ["a,1.parquet", "b.parquet"]
+
+
+def test_map_concurrently_keeps_order_and_collects_failures() -> None:
+    def work(x: int) -> int:
+        if x == 2:
+            raise ValueError("bad item")
+        return x * 10
+
+    results, errors = map_concurrently(work, [1, 2, 3, 4], max_workers=3)
+
+    assert results == [10, 30, 40]
+    assert errors == ["2: bad item"]
+
+
+def test_save_dataframe_stores_parquet_metadata(tmp_path: Path) -> None:
+    df = pd.DataFrame({"year": [2020, 2021], "works_count": [3, 4]})
+    path = save_dataframe(
+        df, tmp_path / "table.parquet", metadata={"label": "climate_change"}
+    )
+
+    assert read_table_metadata(path) == {"label": "climate_change"}
+    assert load_dataframe(path).equals(df)
+
+
+def test_constant_categorical() -> None:
+    col = constant_categorical("en.wikipedia.org", 3)
+    assert list(col) == ["en.wikipedia.org"] * 3
+    assert list(col.categories) == ["en.wikipedia.org"]
+
+    missing = constant_categorical(None, 2)
+    assert missing.isna().all()
+
+
+def test_map_concurrently_computes_duplicates_once() -> None:
+    calls: List[str] = []
+
+    def work(label: str) -> str:
+        calls.append(label)
+        return label.upper()
+
+    results, errors = map_concurrently(work, ["a", "b", "a"])
+
+    assert results == ["A", "B", "A"]
+    assert errors == []
+    assert sorted(calls) == ["a", "b"]
+
+
+def test_narrow_int_only_when_values_fit() -> None:
+    years = pd.Series([1990, 2025], dtype="int64")
+    assert narrow_int(years, "int16").dtype == "int16"
+
+    big = pd.Series([0, 2**40], dtype="int64")
+    assert narrow_int(big, "uint32").dtype == "int64"
+
+
+def test_layout_subpath_follows_reassigned_dirs(tmp_path: Path) -> None:
+    layout = DataLakeLayout(
+        root=tmp_path,
+        raw_dir=tmp_path / "raw",
+        clean_dir=tmp_path / "clean",
+        feature_dir=tmp_path / "feature",
+        metric_dir=tmp_path / "metric",
+    )
+    layout.raw_dir = tmp_path / "elsewhere"
+
+    assert layout.subpath("raw", "a.csv") == tmp_path / "elsewhere" / "a.csv"
+    assert set(asdict(layout)) == {
+        "root",
+        "raw_dir",
+        "clean_dir",
+        "feature_dir",
+        "metric_dir",
+    }
+    with pytest.raises(ValueError):
+        layout.subpath("bogus")
+
+
+@dataclass(frozen=True)
+class _SourceConfig:
+    label: str
+    year_from: int = 1990
+    extra: Optional[str] = None
+
+
+def test_config_metadata_drops_unset_fields() -> None:
+    assert config_metadata(_SourceConfig("cc")) == {"label": "cc", "year_from": "1990"}
+    with pytest.raises(TypeError):
+        config_metadata(_SourceConfig)
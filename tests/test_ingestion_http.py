@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from emo.ingestion import owid
+from emo.ingestion._http import ValidatorCache, download_to_file, get_session
+from emo.ingestion.base import DataLakeLayout
+
+
+def _serve_dir(directory: Path) -> ThreadingHTTPServer:
+    handler = partial(SimpleHTTPRequestHandler, directory=str(directory))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_download_to_file_streams_body(tmp_path: Path) -> None:
+    """
+    A served file is streamed to the target path with no leftover .part file.
+    """
+    served = tmp_path / "served"
+    served.mkdir()
+    body = b"year,skill\n" + b"".join(b"%d,0.5\n" % y for y in range(1900, 2025))
+    (served / "skill.csv").write_bytes(body)
+
+    server = _serve_dir(served)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/skill.csv"
+        target = tmp_path / "out" / "skill.csv"
+        target.parent.mkdir()
+        assert download_to_file(url, target) == (target, False)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert target.read_bytes() == body
+    assert not (tmp_path / "out" / "skill.csv.part").exists()
+
+
+def test_download_to_file_skips_unchanged(tmp_path: Path) -> None:
+    """
+    A second conditional download of an unchanged file returns the first copy.
+    """
+    served = tmp_path / "served"
+    served.mkdir()
+    (served / "co2.csv").write_bytes(b"year,co2\n2020,1\n")
+
+    server = _serve_dir(served)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/co2.csv"
+        cache = ValidatorCache(tmp_path / "http_cache.json")
+        first = download_to_file(url, tmp_path / "first.csv", cache=cache)
+
+        reloaded = ValidatorCache(tmp_path / "http_cache.json")
+        second = download_to_file(url, tmp_path / "second.csv", cache=reloaded)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert first == (tmp_path / "first.csv", False)
+    assert second == (tmp_path / "first.csv", True)
+    assert not (tmp_path / "second.csv").exists()
+
+
+def test_session_is_shared() -> None:
+    assert get_session() is get_session()
+
+
+def test_owid_pipeline_reports_unchanged_charts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    A re-run against unchanged charts downloads nothing and says so.
+    """
+    served = tmp_path / "served"
+    served.mkdir()
+    (served / "co2.csv").write_bytes(b"year,co2\n2020,1\n")
+    layout = DataLakeLayout(
+        root=tmp_path,
+        raw_dir=tmp_path / "raw",
+        clean_dir=tmp_path / "clean",
+        feature_dir=tmp_path / "feature",
+        metric_dir=tmp_path / "metric",
+    )
+    charts = [owid.OWIDChartConfig(chart_id="co2")]
+
+    server = _serve_dir(served)
+    try:
+        monkeypatch.setattr(
+            owid, "OWID_GRAPHER_BASE", f"http://127.0.0.1:{server.server_address[1]}"
+        )
+        first = owid.run_owid_pipeline(charts, layout=layout)
+        second = owid.run_owid_pipeline(charts, layout=layout)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert (first.status, first.records) == ("success", 1)
+    assert (second.status, second.records) == ("skipped_unchanged", 0)
+    assert second.detail == "1 chart(s) unchanged"
+    csv_path = tmp_path / "raw" / "owid" / "co2.csv"
+    assert second.artifacts == {"csv_paths": [str(csv_path)]}
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict
+
+import pandas as pd
+import pytest
+
+from emo.ingestion import gdelt, openalex, wikipedia
+
+
+class _FakeResponse:
+    def __init__(self, payload: Dict[str, Any]) -> None:
+        self.content = json.dumps(payload).encode()
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> Dict[str, Any]:
+        return self._payload
+
+
+class _FakeSession:
+    def __init__(self, payload: Dict[str, Any]) -> None:
+        self._payload = payload
+
+    def get(self, *args: Any, **kwargs: Any) -> _FakeResponse:
+        return _FakeResponse(self._payload)
+
+
+def _serve(
+    monkeypatch: pytest.MonkeyPatch, module: Any, payload: Dict[str, Any]
+) -> None:
+    monkeypatch.setattr(module, "get_session", lambda: _FakeSession(payload))
+
+
+def test_fetch_pageviews_parses_items(monkeypatch: pytest.MonkeyPatch) -> None:
+    _serve(
+        monkeypatch,
+        wikipedia,
+        {
+            "items": [
+                {"timestamp": "2020010200", "views": 5},
+                {"timestamp": "2020010100"},
+            ]
+        },
+    )
+    cfg = wikipedia.WikipediaArticleConfig(project="en.wikipedia.org", article="A")
+
+    df = wikipedia.fetch_pageviews(cfg)
+
+    assert df["date"].tolist() == list(pd.to_datetime(["2020-01-01", "2020-01-02"]))
+    assert df["views"].tolist() == [0, 5]
+    assert df["article"].tolist() == ["A", "A"]
+
+
+def test_fetch_pageviews_empty(monkeypatch: pytest.MonkeyPatch) -> None:
+    _serve(monkeypatch, wikipedia, {"items": []})
+    cfg = wikipedia.WikipediaArticleConfig(project="en.wikipedia.org", article="A")
+
+    assert wikipedia.fetch_pageviews(cfg).empty
+
+
+def test_fetch_works_by_year_skips_bad_keys(monkeypatch: pytest.MonkeyPatch) -> None:
+    _serve(
+        monkeypatch,
+        openalex,
+        {
+            "group_by": [
+                {"key": "2021", "count": 4},
+                {"key": "unknown", "count": 1},
+                {"publication_year": 2020, "count": 3},
+            ]
+        },
+    )
+    cfg = openalex.OpenAlexConceptConfig(label="cc", display_name_search="climate")
+
+    df = openalex.fetch_works_by_year(cfg)
+
+    assert df["year"].tolist() == [2020, 2021]
+    assert df["year"].dtype == "int16"
+    assert df["works_count"].tolist() == [3, 4]
+    assert df["label"].tolist() == ["cc", "cc"]
+
+
+class _FakeGdeltDoc:
+    def timeline_search(self, mode: str, filters: Any) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "datetime": ["2024-01-02 00:00:00", "2024-01-01 00:00:00"],
+                "Value": [7, 5],
+                "All Articles": [100, 90],
+            }
+        )
+
+
+def test_fetch_timeline_for_topic(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gdelt, "GdeltDoc", _FakeGdeltDoc)
+    monkeypatch.setattr(gdelt, "Filters", lambda **kwargs: kwargs)
+    cfg = gdelt.GDELTTopicConfig(keyword="climate change", label="climate_change")
+
+    df = gdelt.fetch_timeline_for_topic(cfg)
+
+    assert list(df.columns) == ["datetime", "count", "topic_label", "keyword"]
+    assert df["datetime"].tolist() == list(pd.to_datetime(["2024-01-01", "2024-01-02"]))
+    assert df["count"].tolist() == [5, 7]
+    assert df["topic_label"].tolist() == ["climate_change"] * 2
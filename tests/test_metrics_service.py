@@ -1,9 +1,12 @@
 # tests/test_metrics_service.py
 from __future__ import annotations
 
+from dataclasses import asdict
+
+import numpy as np
 import pandas as pd
 
-from emo.services.metrics import MetricEngine, UIASummary
+from emo.services.metrics import MetricEngine, UIASummary, _index_labels
 
 
 def test_metric_engine_organismality_from_frames() -> None:
@@ -71,3 +74,51 @@ def test_metric_engine_uia_from_series() -> None:
     assert len(summary.timestamps) == len(index)
     assert isinstance(summary.metadata, dict)
     assert summary.metadata.get("lab") == "test"
+    assert summary.to_dict() == asdict(summary)
+
+
+def test_metric_engine_uia_from_arrays_matches_series_path() -> None:
+    """
+    The NumPy fast path must agree with the Series path on a RangeIndex.
+    """
+    C = [0.2, 0.3, 0.4, 0.5]
+    S = [1.0, 0.95, 0.9, 0.85]
+    I = [0.1, 0.2, 0.35, 0.5]
+    index = pd.RangeIndex(len(C))
+
+    engine = MetricEngine()
+    fast = engine.uia_from_arrays(
+        interface_id="test_interface",
+        R_scalar=1.0,
+        B_scalar=0.5,
+        C=np.asarray(C),
+        S=np.asarray(S),
+        I=np.asarray(I),
+        M_E=0.5,
+    )
+    slow = engine.uia_from_series(
+        interface_id="test_interface",
+        R_scalar=1.0,
+        B_scalar=0.5,
+        C_series=pd.Series(C, index=index),
+        S_series=pd.Series(S, index=index),
+        I_series=pd.Series(I, index=index),
+        M_E=0.5,
+    )
+
+    assert fast == slow
+
+
+def test_uia_summary_timestamps_match_str() -> None:
+    """
+    Vectorised timestamp labels must render exactly like ``str(ts)``.
+    """
+    for index in (
+        pd.date_range("2025-01-01", periods=3, freq="D"),
+        pd.date_range("2025-01-01", periods=3, freq="h", tz="UTC"),
+        pd.DatetimeIndex(["2025-01-01", "2025-01-01 00:00:00.5"]),
+        pd.RangeIndex(3),
+        pd.to_timedelta(["1 day", "2 days 03:00:00"]),
+        pd.Index([1.5, 2.0]),
+    ):
+        assert _index_labels(index) == [str(ts) for ts in index]
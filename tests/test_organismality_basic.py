@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+from dataclasses import asdict
+
+import numpy as np
 import pandas as pd
 
-from emo.organismality import compute_organismality_index
+from emo.organismality import (
+    compute_organismality_index,
+    compute_organismality_index_from_arrays,
+)
 
 
 def test_compute_organismality_index_basic() -> None:
@@ -12,6 +18,7 @@ def test_compute_organismality_index_basic() -> None:
     We build tiny toy dataframes with obvious structure and assert that:
     - the result is in [0, 1]
     - regions appear in the regional index
+    - to_dict() mirrors asdict() without sharing the regional mapping
     """
     treaties = pd.DataFrame(
         {
@@ -30,3 +37,19 @@ def test_compute_organismality_index_basic() -> None:
 
     assert 0.0 <= result.global_oi <= 1.0
     assert set(result.regional_oi.keys()) == {"A", "B", "C"}
+
+    as_dict = result.to_dict()
+    assert as_dict == asdict(result)
+    assert as_dict["regional_oi"] is not result.regional_oi
+
+
+def test_compute_organismality_index_from_arrays_matches_frames() -> None:
+    treaties = pd.DataFrame({"region": ["A", "B", "C"], "treaty_count": [10, 5, 0]})
+    conflicts = pd.DataFrame({"region": ["A", "C"], "conflict_deaths": [0, 20]})
+
+    from_frames = compute_organismality_index(treaties, conflicts)
+    from_arrays = compute_organismality_index_from_arrays(
+        ["A", "B", "C"], np.array([10, 5, 0]), [0.0, np.nan, 20.0]
+    )
+
+    assert from_arrays == from_frames
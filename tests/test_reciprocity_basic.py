@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+
+from emo.reciprocity import compute_reciprocity_fluxes
+
+
+def test_compute_reciprocity_fluxes_skips_missing() -> None:
+    """
+    Missing samples are ignored when averaging each proxy.
+    """
+    buffering = pd.Series([1.0, np.nan, 3.0])
+    selection = pd.Series([4, None, 4, 4], dtype="Int64")
+
+    result = compute_reciprocity_fluxes(buffering, selection)
+
+    assert result.JB == 2.0
+    assert result.B == 4.0
+    assert result.R == 0.5
+    assert result.to_dict() == asdict(result)
+
+
+def test_compute_reciprocity_fluxes_empty() -> None:
+    result = compute_reciprocity_fluxes(pd.Series([np.nan]), pd.Series([1.0]))
+
+    assert (result.R, result.JB, result.B) == (1.0, 0.0, 0.0)
+    assert result.metadata == {"definition": "empty"}